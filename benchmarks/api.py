@@ -0,0 +1,70 @@
+"""
+Embedding API benchmark.
+
+Serves a stream of requests for one small program the way a service
+would: by compiling the source on every request, and by compiling it
+once with sanskrit.compile() and reusing the Program on every engine,
+from one thread and from several.
+
+    python benchmarks/api.py [requests] [threads]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import sanskrit
+from sanskrit import Compiler, VirtualMachine
+from sanskrit.api import ENGINES
+
+PROGRAM = """
+कार्यम् वर्गयोग(n) {
+    स्थापय योग = 0;
+    स्थापय i = 1;
+    दौर (i <= n) {
+        स्थापय योग = योग + i * i;
+        स्थापय i = i + 1;
+    }
+    प्रतिफलम् योग;
+}
+
+कार्यम् मुख्य() {
+    लेखय(वर्गयोग(50));
+    प्रतिफलम् 0;
+}
+"""
+
+
+def compile_each_time():
+    output = []
+    VirtualMachine(Compiler(PROGRAM).compile_bytecode(), output.append).run()
+    return "".join(output)
+
+
+def serve(label, handle, requests, threads):
+    start = time.perf_counter()
+    if threads == 1:
+        outputs = [handle() for _ in range(requests)]
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            outputs = list(pool.map(lambda _: handle(), range(requests)))
+    elapsed = time.perf_counter() - start
+    assert set(outputs) == {"42925\n"}, set(outputs)
+    print(f"  {label:<28} {requests / elapsed:>10,.0f} requests/sec")
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    for count in (1, threads):
+        print(f"{requests:,} requests on {count} thread(s):")
+        serve("compile every request (vm)", compile_each_time, requests // 10, count)
+        for engine in ENGINES:
+            program = sanskrit.compile(PROGRAM, engine=engine)
+            serve(f"compiled once ({engine})", lambda: program.run().output, requests, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Lexer throughput benchmark.
+
+Compares the single-pass regex scanner in the sanskrit package against the
+original character-by-character lexer on a large synthetic .skt corpus.
+
+    python benchmarks/lexer.py [number_of_functions]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit.lexer import KEYWORDS, Lexer, Token, TT_COMMA, TT_EOF, TT_EQ, TT_IDENTIFIER, \
+    TT_KEYWORD, TT_LBRACE, TT_LPAREN, TT_NUMBER, TT_OPERATOR, TT_RBRACE, TT_RPAREN, TT_SEMICOLON
+
+
+class LegacyLexer:
+    """The original character-by-character lexer, kept as the baseline."""
+    def __init__(self, text):
+        self.text = text
+        self.pos = 0
+        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
+
+    def advance(self):
+        self.pos += 1
+        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
+
+    def skip_whitespace(self):
+        while self.current_char is not None and self.current_char.isspace():
+            self.advance()
+
+    def skip_comment(self):
+        while self.current_char is not None and self.current_char != '\n':
+            self.advance()
+
+    def number(self):
+        result = ''
+        while self.current_char is not None and self.current_char.isdigit():
+            result += self.current_char
+            self.advance()
+        return int(result)
+
+    def identifier(self):
+        result = ''
+        while self.current_char is not None and (self.current_char.isalnum() or '\u0900' <= self.current_char <= '\u097F'):
+            result += self.current_char
+            self.advance()
+
+        if result in KEYWORDS:
+            return Token(TT_KEYWORD, result)
+        return Token(TT_IDENTIFIER, result)
+
+    def get_next_token(self):
+        while self.current_char is not None:
+            if self.current_char.isspace():
+                self.skip_whitespace()
+                continue
+
+            if self.current_char == '#':
+                self.skip_comment()
+                continue
+
+            if self.current_char.isdigit():
+                return Token(TT_NUMBER, self.number())
+
+            if self.current_char.isalnum() or '\u0900' <= self.current_char <= '\u097F':
+                return self.identifier()
+
+            if self.current_char == '(':
+                self.advance()
+                return Token(TT_LPAREN, '(')
+
+            if self.current_char == ')':
+                self.advance()
+                return Token(TT_RPAREN, ')')
+
+            if self.current_char == '{':
+                self.advance()
+                return Token(TT_LBRACE, '{')
+
+            if self.current_char == '}':
+                self.advance()
+                return Token(TT_RBRACE, '}')
+
+            if self.current_char == ',':
+                self.advance()
+                return Token(TT_COMMA, ',')
+
+            if self.current_char == '=':
+                self.advance()
+                if self.current_char == '=':
+                    self.advance()
+                    return Token(TT_OPERATOR, '==')
+                return Token(TT_EQ, '=')
+
+            if self.current_char == ';':
+                self.advance()
+                return Token(TT_SEMICOLON, ';')
+
+            if self.current_char in ['+', '-', '*', '/', '%', '<', '>']:
+                op = self.current_char
+                self.advance()
+                if self.current_char == '=':
+                    op += self.current_char
+                    self.advance()
+                return Token(TT_OPERATOR, op)
+
+            raise Exception(f"Invalid character: '{self.current_char}'")
+
+        return Token(TT_EOF, None)
+
+
+def generate_corpus(functions):
+    """Builds a synthetic program with the given number of function definitions."""
+    parts = []
+    for i in range(functions):
+        parts.append(f"""
+# सहायक कार्य {i}
+कार्यम् गणना{i}(क, ख) {{
+    स्थापय योग = क + ख * {i};
+    दौर (योग > 0) {{
+        यदि (योग % 2 == 0) {{
+            लेखय(योग);
+        }} अन्यथा {{
+            स्थापय योग = योग - 1;
+        }}
+        स्थापय योग = योग - {i + 1};
+    }}
+    प्रतिफलम् योग;
+}}
+""")
+    return "".join(parts)
+
+
+def legacy_tokens(text):
+    lexer = LegacyLexer(text)
+    tokens = []
+    while True:
+        token = lexer.get_next_token()
+        tokens.append(token)
+        if token.type == TT_EOF:
+            return tokens
+
+
+def regex_tokens(text):
+    return list(Lexer(text).tokenize())
+
+
+def measure(name, scan, text, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = scan(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    rate = len(tokens) / best
+    print(f"  {name:<8} {len(tokens):>10,} tokens  {best * 1000:>9.1f} ms  {rate:>12,.0f} tokens/sec")
+    return tokens, rate
+
+
+def main():
+    functions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    text = generate_corpus(functions)
+    print(f"Corpus: {functions:,} functions, {text.count(chr(10)):,} lines, {len(text):,} characters")
+
+    old, old_rate = measure("legacy", legacy_tokens, text)
+    new, new_rate = measure("regex", regex_tokens, text)
+
+    if [(t.type, t.value) for t in old] != [(t.type, t.value) for t in new]:
+        print("❌ Token streams differ between lexers")
+        sys.exit(1)
+    print(f"  speedup  {new_rate / old_rate:.2f}x (token streams identical)")
+
+
+if __name__ == "__main__":
+    main()
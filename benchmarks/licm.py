@@ -0,0 +1,120 @@
+"""
+Loop-invariant code motion benchmark.
+
+Runs loop nests that recompute values their inner loops never change,
+compiled with and without --no-licm, on the in-process VM and as native
+binaries built with g++ at -O0 and -O2, and reports the speed-up. Native
+binaries get ten times the size (a hundred times the work) so that their
+run time is not lost in process start-up; each is timed best of three.
+
+    python benchmarks/licm.py [size]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler, VirtualMachine
+
+# The inputs are parameters, so constant folding cannot precompute anything.
+# Every term but j's depends only on the outer loop or on nothing at all.
+NESTED = """
+कार्यम् गणना(n, a, b) {
+    स्थापय योग = 0;
+    स्थापय i = 0;
+    दौर (i < n) {
+        स्थापय j = 0;
+        दौर (j < n * 2) {
+            स्थापय योग = (योग + (a * a + b * b) % 97 + i * a * b + j) % 100003;
+            स्थापय j = j + 1;
+        }
+        स्थापय i = i + 1;
+    }
+    प्रतिफलम् योग;
+}
+
+कार्यम् मुख्य() {
+    लेखय(गणना(SIZE, 12, 34));
+    प्रतिफलम् 0;
+}
+"""
+
+# An invariant value declared in the loop, then used inside a यदि.
+BRANCHY = """
+कार्यम् गणना(n, सीमा) {
+    स्थापय गणक = 0;
+    स्थापय i = 0;
+    दौर (i < n * n) {
+        स्थापय मध्य = सीमा * सीमा / 4 + सीमा % 7;
+        यदि (i % 3 == 0) {
+            स्थापय गणक = गणक + मध्य * 2 - सीमा;
+        } अन्यथा {
+            स्थापय गणक = गणक + 1;
+        }
+        स्थापय गणक = गणक % 100003;
+        स्थापय i = i + 1;
+    }
+    प्रतिफलम् गणक;
+}
+
+कार्यम् मुख्य() {
+    लेखय(गणना(SIZE, 50));
+    प्रतिफलम् 0;
+}
+"""
+
+PROGRAMS = {
+    'nested': NESTED,
+    'branchy': BRANCHY,
+}
+
+
+def run_vm(source, licm):
+    output = []
+    compiler = Compiler(source, licm=licm)
+    functions = compiler.compile_bytecode()
+    start = time.perf_counter()
+    VirtualMachine(functions, output.append).run()
+    return time.perf_counter() - start, "".join(output).strip()
+
+
+def run_native(source, licm, level, directory):
+    binary = os.path.join(directory, f"program-{int(licm)}-{level}")
+    code = Compiler(source, licm=licm).compile()
+    subprocess.run(["g++", f"-O{level}", "-x", "c++", "-", "-o", binary], input=code, text=True,
+                   check=True)
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        result = subprocess.run([binary], capture_output=True, text=True, check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result.stdout.strip()
+
+
+def compare(label, measure):
+    before, expected = measure(False)
+    after, output = measure(True)
+    assert output == expected, f"{label}: {output} != {expected}"
+    print(f"  {label:<18} {before * 1000:>9.1f} ms -> {after * 1000:>9.1f} ms  "
+          f"{before / after:>5.2f}x")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    print(f"Loop nests of size {size}, without LICM -> with it")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, template in PROGRAMS.items():
+            print(f"{name}:")
+            source = template.replace("SIZE", str(size))
+            compare("vm", lambda licm: run_vm(source, licm))
+            source = template.replace("SIZE", str(size * 10))
+            for level in ("0", "2"):
+                compare(f"g++ -O{level}", lambda licm: run_native(source, licm, level, directory))
+
+
+if __name__ == "__main__":
+    main()
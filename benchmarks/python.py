@@ -0,0 +1,95 @@
+"""
+Python backend benchmark.
+
+Runs loop-heavy and deeply recursive programs on the bytecode VM and as
+Python code objects, and reports how long each takes to get ready (the
+full compile, or loading the cached .pyc) and to run.
+
+    python benchmarks/python.py [size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import BuildCache, Compiler, VirtualMachine, build_code, run_code
+
+# c++/program.skt, counting down from SIZE instead of 10
+COUNTDOWN = """
+कार्यम् मुख्य() {
+    स्थापय x = SIZE;
+    स्थापय y = 0;
+    दौर (x > 0) {
+        यदि (x % 2 == 0) {
+            स्थापय y = (y + x) % 1000003;
+        } अन्यथा {
+            स्थापय y = y - 1;
+        }
+        स्थापय x = x - 1;
+    }
+    लेखय(y);
+    प्रतिफलम् 0;
+}
+"""
+
+# Every call but the last leaves a multiplication pending.
+RECURSIVE = """
+कार्यम् गुणन(n) {
+    यदि (n <= 1) {
+        प्रतिफलम् 1;
+    }
+    प्रतिफलम् (n * गुणन(n - 1)) % 1000003;
+}
+
+कार्यम् मुख्य() {
+    लेखय(गुणन(SIZE / 10));
+    प्रतिफलम् 0;
+}
+"""
+
+PROGRAMS = {
+    'countdown': COUNTDOWN,
+    'recursive': RECURSIVE,
+}
+
+
+def run_vm(source):
+    output = []
+    start = time.perf_counter()
+    functions = Compiler(source).compile_bytecode()
+    ready = time.perf_counter()
+    VirtualMachine(functions, output.append).run()
+    return ready - start, time.perf_counter() - ready, "".join(output)
+
+
+def run_python(source, cache):
+    output = []
+    start = time.perf_counter()
+    code, _ = build_code(source, {}, cache)
+    ready = time.perf_counter()
+    run_code(code, output.append)
+    return ready - start, time.perf_counter() - ready, "".join(output)
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Programs of size {size:,}: time to get ready + time to run")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = BuildCache(directory)
+        for name, template in PROGRAMS.items():
+            source = template.replace("SIZE", str(size))
+            print(f"{name}:")
+            results = [("vm", run_vm(source)),
+                       ("python (compiled)", run_python(source, cache)),
+                       ("python (cached)", run_python(source, cache))]
+            vm_run = results[0][1][1]
+            for label, (ready, ran, output) in results:
+                assert output == results[0][1][2], f"{label}: {output!r}"
+                print(f"  {label:<18} {ready * 1000:>8.2f} ms + {ran * 1000:>9.1f} ms  "
+                      f"{vm_run / ran:>5.1f}x the VM's speed")
+
+
+if __name__ == "__main__":
+    main()
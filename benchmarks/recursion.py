@@ -0,0 +1,67 @@
+"""
+Deep recursion benchmark for the in-process interpreter.
+
+Runs a factorial-shaped recursion (a pending multiplication on every frame)
+and a tail-recursive loop, both 100,000 calls deep, and reports calls/sec.
+
+    python benchmarks/recursion.py [depth]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler, VirtualMachine
+
+# Not a tail call: every frame stays live until the innermost call returns.
+FACTORIAL = """
+कार्यम् भाज्यम्(n) {
+    यदि (n <= 1) {
+        प्रतिफलम् 1;
+    }
+    प्रतिफलम् n * भाज्यम्(n - 1);
+}
+
+कार्यम् मुख्य() {
+    लेखय(भाज्यम्(DEPTH));
+    प्रतिफलम् 0;
+}
+"""
+
+# A tail call: runs in a single reused frame.
+TAIL_SUM = """
+कार्यम् योग(n, फल) {
+    यदि (n == 0) {
+        प्रतिफलम् फल;
+    }
+    प्रतिफलम् योग(n - 1, फल + n);
+}
+
+कार्यम् मुख्य() {
+    लेखय(योग(DEPTH, 0));
+    प्रतिफलम् 0;
+}
+"""
+
+
+def measure(name, source, depth):
+    output = []
+    functions = Compiler(source.replace("DEPTH", str(depth))).compile_bytecode()
+    start = time.perf_counter()
+    VirtualMachine(functions, output.append).run()
+    elapsed = time.perf_counter() - start
+    calls = depth + 1   # including मुख्य
+    print(f"  {name:<10} {calls:>9,} calls  {elapsed * 1000:>8.1f} ms  "
+          f"{calls / elapsed:>12,.0f} calls/sec  -> {output[0].strip()}")
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Recursion depth {depth:,} (Python recursion limit is {sys.getrecursionlimit():,})")
+    measure("factorial", FACTORIAL, depth)
+    measure("tail call", TAIL_SUM, depth)
+
+
+if __name__ == "__main__":
+    main()
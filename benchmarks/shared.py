@@ -0,0 +1,76 @@
+"""
+Shared library benchmark.
+
+Times one call of a small कार्यम् made by running a compiled binary per
+call, by the bytecode VM, by the Python backend and through the ctypes
+shared library, after each has been built once.
+
+    python benchmarks/shared.py [calls]
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler, VirtualMachine, build_code, run_code
+from sanskrit.shared import SharedLibrary, build_shared
+
+PROGRAM = """
+कार्यम् योगम्(a, b) {
+    लेखय(a + b);
+    प्रतिफलम् a + b;
+}
+
+कार्यम् मुख्य() {
+    प्रतिफलम् योगम्(2, 3);
+}
+"""
+
+FLAGS = {"fold": True, "dce": True, "licm": True, "memoize": False, "memo_size": None,
+         "dialect": "function", "target": "c++"}
+
+
+def per_call(label, calls, call):
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    elapsed = (time.perf_counter() - start) / calls
+    print(f"  {label:<22} {elapsed * 1e6:>10.2f} µs per call")
+    return elapsed
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as directory:
+        binary = os.path.join(directory, "program")
+        subprocess.run(["g++", "-O2", "-x", "c++", "-", "-o", binary],
+                       input=Compiler(PROGRAM).compile(), text=True, check=True)
+        functions = Compiler(PROGRAM).compile_bytecode()
+        code, _ = build_code(PROGRAM, FLAGS)
+        _, namespace = run_code(code, lambda text: None)
+        namespace["_write"] = lambda text: None
+        add = namespace["f_yogm"]
+        library_path = os.path.join(directory, "program.so")
+        build_shared(PROGRAM, FLAGS, library_path)
+        library = SharedLibrary(library_path)
+
+        print("Calling योगम्(2, 3), which prints and returns 5")
+        process = per_call("process per call", max(1, calls // 1000),
+                           lambda: subprocess.run([binary], capture_output=True))
+        vm = VirtualMachine(functions, write=lambda text: None)
+        per_call("bytecode VM", calls, lambda: vm.execute(functions[0], [2, 3]))
+        per_call("Python backend", calls, lambda: add(2, 3))
+
+        def shared():
+            library.call("योगम्", 2, 3)
+            library.output()
+        library_call = per_call("shared library", calls, shared)
+        assert library.call("योगम्", 2, 3) == 5 and library.output() == "5\n"
+        print(f"The shared library call is {process / library_call:,.0f}x cheaper than a process.")
+
+
+if __name__ == "__main__":
+    main()
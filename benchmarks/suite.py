@@ -0,0 +1,282 @@
+"""
+Compiler scaling benchmark.
+
+Generates programs of growing size along four axes (straight-line
+assignments, nested यदि/दौर blocks, many function definitions and long
+expressions) and times every compiler variant and execution engine on
+each. Every measurement runs in a fresh process so its peak RSS is its
+own. Results can be saved as a baseline and compared against later.
+
+    python benchmarks/suite.py [--quick] [--only GENERATOR] [--repeat N]
+                               [--save PATH] [--compare PATH]
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit.compiler import Compiler
+from sanskrit.pyexec import build_code, run_code
+from sanskrit.shared import SharedLibrary, build_shared
+from sanskrit.vm import VirtualMachine
+
+
+def gen_assignments(n):
+    """A main with `n` chained स्थापय lines."""
+    lines = ["कार्यम् मुख्य() {", "    स्थापय मान0 = 1;"]
+    for i in range(1, n):
+        lines.append(f"    स्थापय मान{i} = (मान{i - 1} * 3 + {i}) % 1000;")
+    lines += [f"    लेखय(मान{n - 1});", "    प्रतिफलम् 0;", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def gen_nesting(depth):
+    """A main whose body nests `depth` alternating यदि and single-pass दौर blocks."""
+    lines = ["कार्यम् मुख्य() {", "    स्थापय x = 0;"]
+    for level in range(depth):
+        indent = "    " * (level + 1)
+        if level % 2:
+            lines.append(f"{indent}यदि (x >= 0) {{")
+        else:
+            lines.append(f"{indent}स्थापय चक्र{level} = 0;")
+            lines.append(f"{indent}दौर (चक्र{level} < 1) {{")
+            lines.append(f"{indent}    स्थापय चक्र{level} = चक्र{level} + 1;")
+        lines.append(f"{indent}    स्थापय x = x + 1;")
+    lines.append("    " * (depth + 1) + "लेखय(x);")
+    for level in reversed(range(depth)):
+        lines.append("    " * (level + 1) + "}")
+    lines += ["    प्रतिफलम् 0;", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def gen_functions(n):
+    """`n` function definitions, each calling the one before it."""
+    parts = ["कार्यम् फलन0(क, ख) {\n    प्रतिफलम् क * 2 + ख;\n}\n"]
+    for i in range(1, n):
+        parts.append(f"""
+कार्यम् फलन{i}(क, ख) {{
+    यदि (क > ख) {{
+        प्रतिफलम् फलन{i - 1}(क - 1, ख) + 1;
+    }}
+    स्थापय योग = क + ख * {i % 10};
+    प्रतिफलम् योग % 1000;
+}}
+""")
+    parts.append(f"""
+कार्यम् मुख्य() {{
+    लेखय(फलन{n - 1}(5, 1));
+    प्रतिफलम् 0;
+}}
+""")
+    return "".join(parts)
+
+
+def gen_expressions(n):
+    """A single assignment whose expression has `n` terms."""
+    operators = ("+", "-", "+", "*")
+    terms = ["1"]
+    for i in range(1, n):
+        term = f"x * {i % 7}" if i % 3 else f"(x % {i % 5 + 2})"
+        terms.append(f"{operators[i % 4]} {term}")
+    return f"""कार्यम् मुख्य() {{
+    स्थापय x = 3;
+    स्थापय y = {' '.join(terms)};
+    लेखय(y);
+    प्रतिफलम् 0;
+}}
+"""
+
+
+GENERATORS = {
+    'assignments': gen_assignments,
+    'nesting': gen_nesting,
+    'functions': gen_functions,
+    'expressions': gen_expressions,
+}
+
+SIZES = {
+    'assignments': (1_000, 10_000, 50_000),
+    'nesting': (10, 50, 200),
+    'functions': (10, 100, 1_000),
+    'expressions': (100, 1_000, 10_000),
+}
+
+
+def run_frontend(source):
+    Compiler(source).parse()
+
+
+def run_cpp(source):
+    Compiler(source).compile()
+
+
+def run_cpp_no_fold(source):
+    Compiler(source, fold=False).compile()
+
+
+def run_cpp_no_dce(source):
+    Compiler(source, dce=False).compile()
+
+
+def run_cpp_no_licm(source):
+    Compiler(source, licm=False).compile()
+
+
+def run_c(source):
+    Compiler(source, target='c').compile()
+
+
+def run_vm(source):
+    functions = Compiler(source).compile_bytecode()
+    VirtualMachine(functions, write=lambda text: None).run()
+
+
+def run_python(source):
+    code, _ = build_code(source, {})
+    run_code(code, lambda text: None)
+
+
+def run_native(source):
+    """
+    Builds the shared library with g++ (-O2) and calls main through ctypes.
+    The g++ time is included; its memory is not part of this process's RSS.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "program.so")
+        build_shared(source, {}, path)
+        SharedLibrary(path).call("main")
+
+
+# Compiler variants and execution engines, each timed from source text
+VARIANTS = {
+    'parse': run_frontend,
+    'c++': run_cpp,
+    'c++ no-fold': run_cpp_no_fold,
+    'c++ no-dce': run_cpp_no_dce,
+    'c++ no-licm': run_cpp_no_licm,
+    'c': run_c,
+    'vm': run_vm,
+    'python': run_python,
+    'native': run_native,
+}
+
+
+def peak_rss_kb():
+    """
+    Peak resident set size of this process in KiB. Linux's ru_maxrss also
+    counts the parent's memory copied in by fork, so prefer the per-process
+    high-water mark from /proc.
+    """
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def worker(path, variant, repeat):
+    """Runs one measurement in this process and prints it as JSON."""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    before = peak_rss_kb()
+    result = {"ok": True, "seconds": None}
+    for _ in range(int(repeat)):
+        start = time.perf_counter()
+        try:
+            VARIANTS[variant](source)
+        except RecursionError:
+            result = {"ok": False, "error": "recursion limit"}
+        except Exception as e:
+            result = {"ok": False, "error": str(e)[:80]}
+        elapsed = time.perf_counter() - start
+        if not result["ok"]:
+            result["seconds"] = elapsed
+            break
+        result["seconds"] = elapsed if result["seconds"] is None else min(result["seconds"], elapsed)
+    peak = peak_rss_kb()
+    result["rss_kb"] = peak
+    result["rss_growth_kb"] = peak - before
+    print(json.dumps(result))
+
+
+def measure(path, variant, repeat):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--worker", path, variant,
+                             str(repeat)],
+                            capture_output=True, text=True)
+    if output.returncode != 0:
+        return {"ok": False, "error": output.stderr.strip().splitlines()[-1][:80],
+                "seconds": 0.0, "rss_kb": 0, "rss_growth_kb": 0}
+    return json.loads(output.stdout)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--quick", action="store_true", help="only the two smallest sizes")
+    arg_parser.add_argument("--only", choices=sorted(GENERATORS), action="append",
+                            help="run just these generators")
+    arg_parser.add_argument("--variant", choices=sorted(VARIANTS), action="append",
+                            help="run just these variants")
+    arg_parser.add_argument("--repeat", type=int, default=3,
+                            help="runs per measurement; the fastest is reported (default: %(default)s)")
+    arg_parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    arg_parser.add_argument("--compare", metavar="PATH", help="show the change against a saved baseline")
+    arg_parser.add_argument("--worker", nargs=3, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+    if args.worker:
+        worker(*args.worker)
+        return
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            for entry in json.load(f)["results"]:
+                baseline[(entry["generator"], entry["size"], entry["variant"])] = entry
+
+    results = []
+    print(f"{'generator':<12} {'size':>7} {'bytes':>10} {'variant':<12} {'ms':>10} "
+          f"{'MB/s':>7} {'peak RSS':>9} {'growth':>9}" + ("  vs baseline" if baseline else ""))
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.only or GENERATORS:
+            sizes = SIZES[name][:2] if args.quick else SIZES[name]
+            for size in sizes:
+                path = os.path.join(directory, f"{name}-{size}.skt")
+                source = GENERATORS[name](size)
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(source)
+                length = len(source.encode("utf-8"))
+                for variant in args.variant or VARIANTS:
+                    result = measure(path, variant, args.repeat)
+                    result.update(generator=name, size=size, variant=variant, bytes=length)
+                    results.append(result)
+                    line = f"{name:<12} {size:>7,} {length:>10,} {variant:<12} "
+                    if not result["ok"]:
+                        print(line + f"❌ {result['error']}")
+                        continue
+                    rate = length / result["seconds"] / 1e6
+                    line += f"{result['seconds'] * 1000:>10.1f} {rate:>7.2f} " \
+                            f"{result['rss_kb'] / 1024:>7.1f}MB {result['rss_growth_kb'] / 1024:>7.1f}MB"
+                    old = baseline.get((name, size, variant))
+                    if old and old["ok"]:
+                        line += f"  {result['seconds'] / old['seconds']:>5.2f}x time, " \
+                                f"{result['rss_kb'] / old['rss_kb']:>5.2f}x RSS"
+                    print(line)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "machine": platform.machine(),
+                       "created": time.strftime("%Y-%m-%d %H:%M:%S"), "results": results}, f, indent=2)
+        print(f"Baseline written to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Token representation benchmark.
+
+Measures per-token memory and construction/dispatch throughput of the
+compact __slots__ Token with integer kinds in the sanskrit package against
+the original dict-backed Token with string kinds, on a 1M-token input.
+
+    python benchmarks/tokens.py [number_of_tokens]
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit.lexer import Token, TT_IDENTIFIER, TT_NUMBER, TT_SEMICOLON
+
+
+class LegacyToken:
+    """The original token: a regular object with string token types."""
+    def __init__(self, type, value, line=0, col=0):
+        self.type = type
+        self.value = value
+        self.line = line
+        self.col = col
+
+
+def build(token_class, kinds, count):
+    """Creates `count` distinct tokens cycling through the given kinds."""
+    values = ('संख्या', 10, ';')
+    return [token_class(kinds[i % 3], values[i % 3]) for i in range(count)]
+
+
+def dispatch(tokens, kind):
+    """The comparison eat() performs on every token."""
+    matched = 0
+    for token in tokens:
+        if token.type == kind:
+            matched += 1
+    return matched
+
+
+def measure(name, token_class, kinds, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tokens = build(token_class, kinds, count)
+    built = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    dispatch(tokens, kinds[2])
+    compared = time.perf_counter() - start
+
+    per_token = size / count
+    print(f"  {name:<8} {per_token:>6.1f} bytes/token  "
+          f"{count / built:>12,.0f} tokens/sec built  {count / compared:>12,.0f} tokens/sec compared")
+    return per_token
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{count:,} tokens")
+    old = measure("legacy", LegacyToken, ('IDENTIFIER', 'NUMBER', 'SEMICOLON'), count)
+    new = measure("compact", Token, (TT_IDENTIFIER, TT_NUMBER, TT_SEMICOLON), count)
+    print(f"  saving   {old - new:.1f} bytes/token ({(1 - new / old) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,4 +15,4 @@ int main() {
     }
     cout << y << endl;
     return 0;
-}
\ No newline at end of file
+}
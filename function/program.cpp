@@ -6,9 +6,7 @@ int yogm(int a, int b) {
 }
 
 int main() {
-    int smkhyaa1 = 10;
-    int smkhyaa2 = 15;
-    int prinaam = yogm ( smkhyaa1 , smkhyaa2 );
+    int prinaam = yogm ( 10 , 15 );
     cout << prinaam << endl;
     return 0;
 }
@@ -1,4 +1,5 @@
 #include <stdio.h>
+
 int main() {
     int i = 0;
     while (i < 5) {
@@ -6,4 +7,4 @@ int main() {
         i = i + 1;
     }
     return 0;
-}
\ No newline at end of file
+}
@@ -1,7 +1,6 @@
 #include <stdio.h>
+
 int main() {
-    int a = 3;
-    int b = a + 2;
-    printf("%d\n", b);
+    printf("%d\n", 5);
     return 0;
-}
\ No newline at end of file
+}
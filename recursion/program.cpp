@@ -9,8 +9,7 @@ int bhaajym(int n) {
 }
 
 int main() {
-    int smkhyaa = 5;
-    int prinaam = bhaajym ( smkhyaa );
+    int prinaam = bhaajym ( 5 );
     cout << prinaam << endl;
     return 0;
 }
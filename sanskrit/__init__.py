@@ -0,0 +1,43 @@
+"""
+Compiler for the Sanskrit programming language.
+
+One lexer, parser and IR serve every dialect: 'print', 'loop', 'condition'
+and 'function' each accept a larger subset of the grammar, and any of them
+can be emitted as C, C++ or Python, or run in-process on the bytecode VM,
+as a cached Python code object or as a shared library loaded with ctypes.
+
+To run programs from Python, compile once and reuse the Program:
+
+    program = sanskrit.compile(source)
+    result = program.call('योगम्', 2, 3)    # result.value, result.output
+"""
+from importlib import import_module
+
+# Public names and the module each lives in. They are imported on first
+# use, so `import sanskrit` stays cheap for callers that need one of them.
+_EXPORTS = {
+    'Program': 'api', 'Result': 'api', 'compile': 'api',
+    'CBackend': 'backend', 'CppBackend': 'backend', 'PythonBackend': 'backend',
+    'SharedBackend': 'backend', 'TARGETS': 'backend',
+    'BuildCache': 'cache', 'build_binary': 'cache',
+    'Compiler': 'compiler',
+    'IncrementalCompiler': 'incremental',
+    'KEYWORDS': 'lexer', 'Lexer': 'lexer', 'Token': 'lexer',
+    'DIALECTS': 'parser', 'Parser': 'parser',
+    'build_code': 'pyexec', 'run_code': 'pyexec',
+    'SharedLibrary': 'shared', 'build_shared': 'shared',
+    'BytecodeCompiler': 'vm', 'VirtualMachine': 'vm',
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,144 @@
+import os
+import tempfile
+import threading
+from contextlib import nullcontext
+from functools import lru_cache
+
+from .compiler import Compiler
+from .pyexec import build_code, call_captured, load_module
+from .shared import SharedLibrary, build_shared
+from .vm import BytecodeCompiler, VirtualMachine, wrap_int
+
+# =====================================================================
+# Embedding API
+# =====================================================================
+# For services that run programs in-process: compile() turns source into
+# a Program once, and the Program can then be run, or have single
+# functions called, any number of times from any number of threads. Each
+# run returns its own लेखय output. Programs are immutable, so compile()
+# hands out the same Program for the same source and options and a hot
+# program is compiled once per process.
+
+# Programs compile() keeps for reuse
+PROGRAM_CACHE_SIZE = 256
+
+class Result:
+    """What one run or call produced: its return value and everything लेखय printed."""
+    __slots__ = ('value', 'output')
+
+    def __init__(self, value, output):
+        self.value = value
+        self.output = output
+
+    def __repr__(self):
+        return f"Result(value={self.value!r}, output={self.output!r})"
+
+class PythonEngine:
+    """Runs the Python backend's module, loaded from its (cached) code object."""
+    def __init__(self, source, flags, cache=None):
+        code, _ = build_code(source, flags, cache)
+        self.namespace = load_module(code)
+        # Sanskrit name -> (C spelling, parameter count)
+        self.functions = {name: (python_name[2:], arity)
+                          for name, (python_name, arity) in self.namespace["_functions"].items()}
+        self.inline = not flags.get("memoize")
+
+    def call(self, spelling, args):
+        return call_captured(self.namespace["f_" + spelling], args, self.inline)
+
+class VMEngine:
+    """Runs bytecode on a VirtualMachine made for each call."""
+    def __init__(self, source, flags, cache=None):
+        compiler = Compiler(source, **flags)
+        program = compiler.build()
+        self.bytecode = BytecodeCompiler(program, compiler.memoized, compiler.memo_size).compile()
+        self.index = {func.name: func for func in self.bytecode}
+        self.functions = {func.symbols[0].name: (func.name, len(func.params))
+                          for func in program.functions}
+        # Memo caches live in the bytecode, so memoized programs run one call at a time
+        self.lock = threading.Lock() if compiler.memoized else nullcontext()
+
+    def call(self, spelling, args):
+        output = []
+        with self.lock:
+            value = VirtualMachine(self.bytecode, output.append).execute(self.index[spelling], list(args))
+        return value, "".join(output)
+
+class NativeEngine:
+    """Calls into the program built as a shared library with g++."""
+    def __init__(self, source, flags, cache=None):
+        with tempfile.TemporaryDirectory(prefix="sanskrit-") as directory:
+            path = os.path.join(directory, "program.so")
+            build_shared(source, flags, path, cache)
+            self.library = SharedLibrary(path)
+        self.functions = {name: (spelling, arity) for name, spelling, arity in self.library.exported}
+
+    def call(self, spelling, args):
+        try:
+            value = self.library.call(spelling, *args)
+        finally:
+            # Taken even after an error, so it cannot leak into this thread's next call
+            output = self.library.output()
+        return value, output
+
+# Execution engine for each compile(engine=...)
+ENGINES = {
+    'python': PythonEngine,
+    'vm': VMEngine,
+    'native': NativeEngine,
+}
+
+class Program:
+    """
+    A compiled program. run() and call() may be used any number of times,
+    from any number of threads at once.
+    """
+    def __init__(self, engine):
+        self.engine = engine
+        # Sanskrit name or C spelling -> (C spelling, parameter count)
+        self.functions = dict(engine.functions)
+        for spelling, arity in engine.functions.values():
+            self.functions.setdefault(spelling, (spelling, arity))
+
+    def call(self, name, *args):
+        """Calls a function, by its Sanskrit name or C spelling, with int arguments."""
+        function = self.functions.get(name)
+        if function is None:
+            raise Exception(f"Undefined function: '{name}'")
+        spelling, arity = function
+        if len(args) != arity:
+            raise Exception(f"Function '{name}' takes {arity} arguments, got {len(args)}")
+        value, output = self.engine.call(spelling, tuple(wrap_int(int(arg)) for arg in args))
+        return Result(value, output)
+
+    def run(self):
+        """Runs मुख्य."""
+        return self.call('main')
+
+@lru_cache(maxsize=PROGRAM_CACHE_SIZE)
+def _compile(source, engine, dialect, fold, dce, licm, memoize, memo_size, cache):
+    if engine not in ENGINES:
+        raise Exception(f"Unknown engine: '{engine}'")
+    flags = {"fold": fold, "dce": dce, "licm": licm, "memoize": memoize, "memo_size": memo_size,
+             "dialect": dialect, "target": 'c++'}
+    try:
+        return Program(ENGINES[engine](source, flags, cache))
+    except Exception:
+        if engine != 'python':
+            raise
+    # The generated Python can exceed CPython's own limits (more than 20
+    # nested दौर, very deeply nested expressions) where the VM has none. A
+    # program that is itself in error fails the same way on the VM.
+    return Program(VMEngine(source, flags, cache))
+
+def compile(source, engine='python', dialect='function', fold=True, dce=True, licm=True,
+            memoize=False, memo_size=None, cache=None):
+    """
+    Compiles Sanskrit source into a Program. `engine` chooses how it runs:
+    'python' (the default: generated Python, no toolchain needed), 'vm'
+    (the bytecode interpreter) or 'native' (a shared library built with
+    g++). A program the python engine cannot run as Python runs on the VM
+    instead. A BuildCache lets the python and native engines reuse their
+    compiled form across processes too.
+    """
+    return _compile(source, engine, dialect, fold, dce, licm, memoize, memo_size, cache)
@@ -0,0 +1,558 @@
+import io
+
+from .ir import IRBinary, IRCall, IRConst, IRDeclare, IRGroup, IRIf, IRLoad, IRPrint, IRReturn, \
+    IRStore, IRUnary, IRWhile
+from .nodes import walk_postorder
+from .optimize import MEMO_SIZE
+from .vm import wrap_int
+
+# =====================================================================
+# C++ Backend
+# =====================================================================
+# This part turns the IR into C++ source text. Lines are written to a
+# text sink as they are generated, so the output never has to be held
+# in memory when it goes to a file, stdout or a pipe into the toolchain.
+
+# Bounded LRU cache emitted once when memoization is enabled. Counters are
+# reported on stderr when the program exits.
+CPP_MEMO_CACHE = """\
+template <size_t N>
+class MemoCache {
+    typedef array<int, N> Key;
+    struct KeyHash {
+        size_t operator()(const Key& key) const {
+            size_t h = 0;
+            for (size_t i = 0; i < N; i++) h = h * 1000003u ^ (unsigned) key[i];
+            return h;
+        }
+    };
+    typedef list<pair<Key, int> > Entries;
+    Entries entries;  // most recently used first
+    unordered_map<Key, typename Entries::iterator, KeyHash> index;
+    const char* name;
+    size_t capacity;
+    long long hits = 0, misses = 0;
+public:
+    MemoCache(const char* name, size_t capacity) : name(name), capacity(capacity) {}
+    ~MemoCache() { cerr << name << ": " << hits << " hits, " << misses << " misses" << endl; }
+    bool lookup(const Key& key, int& value) {
+        auto found = index.find(key);
+        if (found == index.end()) { misses++; return false; }
+        entries.splice(entries.begin(), entries, found->second);
+        value = found->second->second;
+        hits++;
+        return true;
+    }
+    void store(const Key& key, int value) {
+        if (index.count(key)) return;
+        entries.emplace_front(key, value);
+        index[key] = entries.begin();
+        if (entries.size() > capacity) {
+            index.erase(entries.back().first);
+            entries.pop_back();
+        }
+    }
+};
+"""
+
+class CppBackend:
+    NAME = 'C++'
+    EXTENSION = '.cpp'
+    TOOLCHAIN = ['g++']
+    LANGUAGE = 'c++'          # the toolchain's -x name, for code piped in on stdin
+    RUN = "{toolchain} {path} -o program && ./program"   # shell command to build and run it
+    PRINT = 'cout << {} << endl;'
+    DIVISION = None           # checked helpers for / and % by a variable, if any
+    LINKAGE = ''              # storage class written before each function
+
+    def __init__(self, memoize=(), memo_size=None, sink=None):
+        # Without a sink the code collects in memory for emit() to return
+        self.sink = sink if sink is not None else io.StringIO()
+        self.separator = ""       # lines are joined by newlines, with none at the end
+        self.memoize = memoize    # names of the functions to wrap in a MemoCache
+        self.memo_size = memo_size or MEMO_SIZE
+        self.function_name = None
+
+    def expression(self, expr):
+        """Renders an IR expression with one space between tokens."""
+        # Walk the tree left to right with an explicit stack of nodes and
+        # literal text still to emit, collecting the pieces for one join.
+        parts = []
+        stack = [expr]
+        while stack:
+            item = stack.pop()
+            kind = type(item)
+            if kind is str:
+                parts.append(item)
+            elif kind is IRConst:
+                parts.append(str(item.value))
+            elif kind is IRLoad:
+                parts.append(item.name)
+            elif kind is IRBinary:
+                if self.DIVISION is not None and item.op in self.DIVISION and \
+                        not (type(item.right) is IRConst and item.right.value not in (0, -1)):
+                    stack += (f' , "{self.function_name}" )', item.right, " , ", item.left,
+                              f"{self.DIVISION[item.op]} ( ")
+                else:
+                    stack += (item.right, f" {item.op} ", item.left)
+            elif kind is IRUnary:
+                stack += (item.operand, f"{item.op} ")
+            elif kind is IRCall:
+                if not item.args:
+                    parts.append(f"{item.name} ( )")
+                    continue
+                stack.append(" )")
+                for index in range(len(item.args) - 1, 0, -1):
+                    stack += (item.args[index], " , ")
+                stack += (item.args[0], f"{item.name} ( ")
+            else:
+                stack += (" )", item.expr, "( ")
+        return "".join(parts)
+
+    def statement(self, stmt, indentation):
+        kind = type(stmt)
+        if kind is IRDeclare:
+            self.line(f"{indentation}int {stmt.name} = {self.expression(stmt.value)};")
+        elif kind is IRStore:
+            self.line(f"{indentation}{stmt.name} = {self.expression(stmt.value)};")
+        elif kind is IRPrint:
+            self.line(indentation + self.PRINT.format(self.expression(stmt.value)))
+        elif kind is IRReturn:
+            self.line(f'{indentation}return {self.expression(stmt.value)};')
+        elif kind is IRIf:
+            self.line(f"{indentation}if ({self.expression(stmt.condition)}) {{")
+            self.block(stmt.body, indentation + "    ")
+            if stmt.orelse is not None:
+                self.line(f"{indentation}}} else {{")
+                self.block(stmt.orelse, indentation + "    ")
+            self.line(f"{indentation}}}")
+        elif kind is IRWhile:
+            self.line(f"{indentation}while ({self.expression(stmt.condition)}) {{")
+            self.block(stmt.body, indentation + "    ")
+            self.line(f"{indentation}}}")
+        else:
+            self.line(f"{indentation}{self.expression(stmt.value)};")
+
+    def line(self, text):
+        """Writes one line of output."""
+        self.sink.write(self.separator + text)
+        self.separator = "\n"
+
+    def block(self, statements, indentation):
+        for stmt in statements:
+            self.statement(stmt, indentation)
+
+    def function(self, func):
+        self.function_name = func.name
+        cpp_params = ", ".join(f"int {param}" for param in func.params)
+        if func.name in self.memoize:
+            self.memoized_function(func, cpp_params)
+            return
+        self.line(f"{self.LINKAGE}int {func.name}({cpp_params}) {{")
+        self.block(func.body, "    ")
+        self.line("}\n")
+
+    def memoized_function(self, func, cpp_params):
+        """Emits the body as <name>_uncached behind a caching <name> wrapper."""
+        # Recursive calls in the body go through the wrapper, so they hit the cache too
+        self.line(f"int {func.name}({cpp_params});\n")
+        self.line(f"int {func.name}_uncached({cpp_params}) {{")
+        self.block(func.body, "    ")
+        self.line("}\n")
+
+        arity = len(func.params)
+        self.line(f"int {func.name}({cpp_params}) {{")
+        self.line(f'    static MemoCache<{arity}> memo("{func.name}", {self.memo_size});')
+        self.line(f"    array<int, {arity}> key = {{{', '.join(func.params)}}};")
+        self.line("    int result;")
+        self.line("    if (memo.lookup(key, result)) {")
+        self.line("        return result;")
+        self.line("    }")
+        self.line(f"    result = {func.name}_uncached({', '.join(func.params)});")
+        self.line("    memo.store(key, result);")
+        self.line("    return result;")
+        self.line("}\n")
+
+    def header(self):
+        """Returns the lines every translation unit starts with."""
+        lines = ["#include <iostream>"]
+        if self.memoize:
+            lines += ["#include <array>", "#include <list>", "#include <unordered_map>"]
+        return lines + ["using namespace std;", ""]
+
+    def footer(self):
+        """Returns the lines that follow the last function."""
+        return []
+
+    def stream(self, program):
+        """Writes the C++ translation unit for an IR program to the sink."""
+        for text in self.header():
+            self.line(text)
+        if self.memoize:
+            self.line(CPP_MEMO_CACHE)
+        for func in program.functions:
+            self.function(func)
+        for text in self.footer():
+            self.line(text)
+
+    def emit(self, program):
+        """Returns the C++ translation unit for an IR program."""
+        self.stream(program)
+        return self.sink.getvalue()
+
+# =====================================================================
+# C Backend
+# =====================================================================
+# Plain C output, as the print, loop and condition compilers always
+# produced: लेखय becomes printf and nothing needs the C++ library.
+
+class CBackend(CppBackend):
+    NAME = 'C'
+    EXTENSION = '.c'
+    TOOLCHAIN = ['gcc']
+    LANGUAGE = 'c'
+    PRINT = 'printf("%d\\n", {});'
+
+    def header(self):
+        return ["#include <stdio.h>", ""]
+
+# =====================================================================
+# Python Backend
+# =====================================================================
+# A Python module with one def per कार्यम्, for running in-process with
+# no C toolchain (see pyexec.py). Values keep the 32-bit C int behaviour
+# of the other targets: +, - and * are exact modulo 2**32, so a tree of
+# them is wrapped back into range once, where its value is used, and /
+# and % truncate toward zero as C does.
+
+# Runtime support every module starts with, after its imports
+PY_RUNTIME = """
+_write = sys.stdout.write
+_functions = {}     # Sanskrit name -> (Python name, parameter count)
+
+
+def _div(a, b):
+    quotient = abs(a) // abs(b)
+    if (a < 0) != (b < 0):
+        quotient = -quotient
+    return (quotient + 2147483648 & 4294967295) - 2147483648
+
+
+def _mod(a, b):
+    remainder = abs(a) % abs(b)
+    return -remainder if a < 0 else remainder
+
+"""
+
+PY_COMPARISONS = ('<', '>', '<=', '>=', '==')
+
+# Deepest दौर nesting CPython compiles: it allows 20 statically nested blocks
+PY_MAX_LOOPS = 20
+
+class PythonBackend(CppBackend):
+    NAME = 'Python'
+    EXTENSION = '.py'
+    TOOLCHAIN = ['python3']
+    LANGUAGE = None
+    RUN = "{toolchain} {path}"
+
+    def __init__(self, memoize=(), memo_size=None, sink=None):
+        super().__init__(memoize, memo_size, sink)
+        self.arities = None     # function name -> parameter count, when the whole program is known
+        self.scopes = []        # names declared in each open block, to reject undefined ones
+        self.loops = 0          # दौर loops open around the statement being emitted
+        self.tail = None        # function whose self tail calls loop instead of recursing
+
+    def expression(self, expr):
+        """Renders an IR expression as a Python expression with an int value in C range."""
+        return self.wrapped(walk_postorder(expr, self.expression_node))
+
+    def condition(self, expr):
+        """Renders a test; a comparison is used as is instead of turned into 1 or 0."""
+        while type(expr) is IRGroup:
+            expr = expr.expr
+        if type(expr) is IRBinary and expr.op in PY_COMPARISONS:
+            return f"{self.expression(expr.left)} {expr.op} {self.expression(expr.right)}"
+        return self.expression(expr)
+
+    def expression_node(self, expr, operands):
+        """
+        Renders one node from its operands' (text, unwrapped) pairs. A +, -
+        or * result may be out of int range, and is unwrapped: '+' for a
+        sum or difference, '*' for a product or negation, so chains come
+        out flat with parentheses only where Python's precedence needs
+        them. Anything else is in range (None) and binds as an atom.
+        """
+        kind = type(expr)
+        if kind is IRConst:
+            return str(wrap_int(expr.value)), None
+        if kind is IRLoad:
+            if not any(expr.name in scope for scope in self.scopes):
+                raise Exception(f"Undefined variable: '{expr.name}'")
+            return "v_" + expr.name, None
+        if kind is IRGroup:
+            return operands[0]
+        if kind is IRUnary:
+            text, unwrapped = operands[0]
+            if expr.op != '-':
+                return text, unwrapped
+            return (f"-({text})" if unwrapped == '+' else f"-{text}"), '*'
+        if kind is IRCall:
+            if self.arities is not None:
+                if expr.name not in self.arities:
+                    raise Exception(f"Undefined function: '{expr.name}'")
+                if len(expr.args) != self.arities[expr.name]:
+                    raise Exception(f"Function '{expr.name}' takes {self.arities[expr.name]} "
+                                    f"arguments, got {len(expr.args)}")
+            args = ", ".join(self.wrapped(operand) for operand in operands)
+            return f"f_{expr.name}({args})", None
+        if expr.op in ('+', '-', '*'):
+            # Python's ints are exact, so + and * regroup freely; only a sum
+            # under * or on the right of - keeps its parentheses
+            (left, left_kind), (right, right_kind) = operands
+            if expr.op == '*':
+                if left_kind == '+':
+                    left = f"({left})"
+                if right_kind == '+':
+                    right = f"({right})"
+                return f"{left} * {right}", '*'
+            if expr.op == '-' and right_kind == '+':
+                right = f"({right})"
+            return f"{left} {expr.op} {right}", '+'
+        left = self.wrapped(operands[0])
+        right = self.wrapped(operands[1])
+        if expr.op in ('/', '%') and type(expr.left) is IRLoad and type(expr.right) is IRConst \
+                and wrap_int(expr.right.value) > 0:
+            # The common x % 2 without a call: Python's // and % agree with C's for x >= 0
+            op = '//' if expr.op == '/' else '%'
+            return f"({left} {op} {right} if {left} >= 0 else -(-{left} {op} {right}))", None
+        if expr.op == '/':
+            return f"_div({left}, {right})", None
+        if expr.op == '%':
+            return f"_mod({left}, {right})", None
+        return f"(1 if {left} {expr.op} {right} else 0)", None
+
+    def wrapped(self, operand):
+        """Brings a rendered (text, unwrapped) pair back into int range."""
+        text, unwrapped = operand
+        return f"({text} + 2147483648 & 4294967295) - 2147483648" if unwrapped else text
+
+    def statement(self, stmt, indentation):
+        kind = type(stmt)
+        if kind is IRDeclare:
+            self.line(f"{indentation}v_{stmt.name} = {self.expression(stmt.value)}")
+            self.scopes[-1].add(stmt.name)
+        elif kind is IRStore:
+            self.line(f"{indentation}v_{stmt.name} = {self.expression(stmt.value)}")
+        elif kind is IRPrint:
+            self.line(f'{indentation}_write(f"{{{self.expression(stmt.value)}}}\\n")')
+        elif kind is IRReturn:
+            call = self.self_tail_call(stmt, self.tail)
+            if call is not None and self.loops == 1:
+                # Only the function's own loop is open, so continue goes round it
+                if call.args:
+                    params = ", ".join("v_" + param for param in self.tail.params)
+                    args = ", ".join(self.expression(arg) for arg in call.args)
+                    self.line(f"{indentation}{params} = {args}")
+                self.line(f"{indentation}continue")
+            else:
+                self.line(f"{indentation}return {self.expression(stmt.value)}")
+        elif kind is IRIf:
+            self.line(f"{indentation}if {self.condition(stmt.condition)}:")
+            self.block(stmt.body, indentation + "    ")
+            if stmt.orelse is not None:
+                self.line(f"{indentation}else:")
+                self.block(stmt.orelse, indentation + "    ")
+        elif kind is IRWhile:
+            if self.loops == PY_MAX_LOOPS:
+                raise Exception(f"दौर loops nested more than {PY_MAX_LOOPS} deep cannot run as "
+                                f"Python; use the VM or the C/C++ target")
+            self.line(f"{indentation}while {self.condition(stmt.condition)}:")
+            self.loops += 1
+            self.block(stmt.body, indentation + "    ")
+            self.loops -= 1
+        else:
+            self.line(f"{indentation}{self.expression(stmt.value)}")
+
+    def block(self, statements, indentation):
+        self.scopes.append(set())
+        for stmt in statements:
+            self.statement(stmt, indentation)
+        if not statements:
+            self.line(f"{indentation}pass")
+        self.scopes.pop()
+
+    def function(self, func):
+        params = ", ".join("v_" + param for param in func.params)
+        if func.name in self.memoize:
+            # Recursive calls look the name up at run time, so they hit the cache too
+            self.line(f"@lru_cache(maxsize={self.memo_size})")
+        self.line(f"def f_{func.name}({params}):")
+        self.scopes = [set(func.params)]
+        # As on the VM, प्रतिफलम् of a call to the function itself reuses the
+        # frame: the body runs in a loop and the call rebinds the parameters
+        # and goes round again. A memoized function's calls must each reach
+        # its cache, so it keeps them.
+        indentation = "    "
+        self.tail = None
+        self.loops = 0
+        if func.name not in self.memoize and self.calls_itself_last(func.body, func):
+            self.line("    while True:")
+            indentation = "        "
+            self.tail = func
+            self.loops = 1
+        self.block(func.body, indentation)
+        if not func.body or type(func.body[-1]) is not IRReturn:
+            # Falling off the end of a function returns 0
+            self.line(f"{indentation}return 0")
+        self.tail = None
+        self.line(f'_functions["{func.symbols[0].name}"] = ("f_{func.name}", {len(func.params)})')
+        self.line("\n")
+
+    def self_tail_call(self, stmt, func):
+        """Returns the call if `stmt` is प्रतिफलम् of a call to `func` with its arity, else None."""
+        if func is None or type(stmt) is not IRReturn:
+            return None
+        value = stmt.value
+        while type(value) is IRGroup:
+            value = value.expr
+        if type(value) is IRCall and value.name == func.name and len(value.args) == len(func.params):
+            return value
+        return None
+
+    def calls_itself_last(self, statements, func):
+        """True if a self tail call of `func` is reachable outside any दौर."""
+        for stmt in statements:
+            if self.self_tail_call(stmt, func) is not None:
+                return True
+            if type(stmt) is IRIf and (self.calls_itself_last(stmt.body, func) or
+                                       (stmt.orelse is not None and
+                                        self.calls_itself_last(stmt.orelse, func))):
+                return True
+        return False
+
+    def header(self):
+        lines = ["# Generated by the Sanskrit compiler", "import sys"]
+        if self.memoize:
+            lines.append("from functools import lru_cache")
+        return lines + [PY_RUNTIME]
+
+    def footer(self):
+        return ['if __name__ == "__main__":', "    sys.setrecursionlimit(100_000)",
+                "    sys.exit(f_main())"]
+
+    def stream(self, program):
+        """Writes the Python module for an IR program to the sink."""
+        self.arities = {}
+        for func in program.functions:
+            if func.name in self.arities:
+                raise Exception(f"Duplicate function: '{func.name}'")
+            self.arities[func.name] = len(func.params)
+        for text in self.header():
+            self.line(text)
+        for func in program.functions:
+            self.function(func)
+        for text in self.footer():
+            self.line(text)
+
+# =====================================================================
+# Shared Library Backend
+# =====================================================================
+# C++ for a shared library that Python loads with ctypes (see shared.py)
+# and calls function by function in its own process. Every कार्यम् is a
+# static function in namespace sanskrit_program, so spellings such as puts
+# or abs cannot clash with the C library; only the sanskrit_* accessors and
+# the sanskrit_entry_<name> trampolines that call them have C linkage.
+# लेखय appends to a per-thread buffer instead of stdout, and a runtime
+# error such as division by zero returns to the caller through the
+# trampoline instead of killing it.
+
+SHARED_RUNTIME = """\
+static thread_local string sanskrit_output;     // what लेखय printed on this thread
+static thread_local jmp_buf sanskrit_trap;      // set by the entry point being run
+static thread_local const char* sanskrit_failed_in;
+static thread_local const char* sanskrit_failure;
+
+static inline void sanskrit_print(int value) {
+    sanskrit_output += to_string(value);
+    sanskrit_output += '\\n';
+}
+
+static void sanskrit_fail(const char* function, const char* error) {
+    sanskrit_failed_in = function;
+    sanskrit_failure = error;
+    longjmp(sanskrit_trap, 1);
+}
+
+static inline int sanskrit_div(int a, int b, const char* function) {
+    if (b == 0) sanskrit_fail(function, "division by zero");
+    return b == -1 ? (int) (0u - (unsigned) a) : a / b;
+}
+
+static inline int sanskrit_mod(int a, int b, const char* function) {
+    if (b == 0) sanskrit_fail(function, "division by zero");
+    return b == -1 ? 0 : a % b;
+}
+
+extern "C" {
+
+const char* sanskrit_output_data() { return sanskrit_output.data(); }
+size_t sanskrit_output_size() { return sanskrit_output.size(); }
+void sanskrit_output_clear() { sanskrit_output.clear(); }
+const char* sanskrit_error_function() { return sanskrit_failed_in; }
+const char* sanskrit_error() { return sanskrit_failure; }
+
+}
+"""
+
+class SharedBackend(CppBackend):
+    NAME = 'C++ shared library'
+    EXTENSION = '.so'
+    OPTIONS = ['-shared', '-fPIC', '-fwrapv']   # -fwrapv: int overflow wraps, as on the VM
+    PRINT = 'sanskrit_print({});'
+    DIVISION = {'/': 'sanskrit_div', '%': 'sanskrit_mod'}
+    LINKAGE = 'static '
+
+    def header(self):
+        return ["#include <setjmp.h>", "#include <string>", "using namespace std;", "",
+                SHARED_RUNTIME]
+
+    def entry(self, func):
+        """
+        Emits sanskrit_entry_<name>, which calls the function and sets
+        *failed instead of returning normally if a runtime error stops it.
+        """
+        params = "".join(f", int sanskrit_arg{index}" for index in range(len(func.params)))
+        args = ", ".join(f"sanskrit_arg{index}" for index in range(len(func.params)))
+        self.line(f"int sanskrit_entry_{func.name}(int* sanskrit_failed{params}) {{")
+        self.line("    if (setjmp(sanskrit_trap)) {")
+        self.line("        *sanskrit_failed = 1;")
+        self.line("        return 0;")
+        self.line("    }")
+        self.line(f"    return sanskrit_program::{func.name}({args});")
+        self.line("}\n")
+
+    def stream(self, program):
+        """Writes the shared library's C++ for an IR program to the sink."""
+        for text in self.header():
+            self.line(text)
+        self.line("namespace sanskrit_program {\n")
+        for func in program.functions:
+            self.function(func)
+        self.line("}\n")
+        self.line('extern "C" {\n')
+        for func in program.functions:
+            self.entry(func)
+        # Source name, C spelling and parameter count of each function, so a
+        # loaded library describes itself
+        table = "".join(f"{func.symbols[0].name}\\t{func.name}\\t{len(func.params)}\\n"
+                        for func in program.functions)
+        self.line(f'const char* sanskrit_functions() {{ return "{table}"; }}')
+        self.line("\n}")
+
+# Backend used for each --target
+TARGETS = {
+    'c': CBackend,
+    'c++': CppBackend,
+    'python': PythonBackend,
+}
@@ -0,0 +1,164 @@
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .backend import TARGETS
+from .cache import BuildCache, build_binary
+from .compiler import Compiler
+from .optimize import add_optimization_arguments, optimizations_from_args
+from .parser import DIALECTS
+
+# =====================================================================
+# Batch Compilation
+# =====================================================================
+# Compiles many .skt files at once, one process per core. Each worker
+# compiles a file end to end (and optionally builds it), so the parent
+# only collects the results.
+
+def find_sources(patterns):
+    """Expands files, directories (searched recursively) and globs into sorted .skt paths."""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, names in os.walk(pattern):
+                paths.update(os.path.join(root, name) for name in names if name.endswith(".skt"))
+        elif os.path.isfile(pattern):
+            paths.add(pattern)
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if path.endswith(".skt"))
+    return sorted(paths)
+
+def output_path(path, base, output_dir, extension):
+    """Places the output next to its input, or at the same relative path under output_dir."""
+    stem = os.path.splitext(path)[0]
+    if output_dir is not None:
+        stem = os.path.join(output_dir, os.path.relpath(stem, base))
+    return stem + extension
+
+def compile_file(path, base, output_dir, dialect, target, optimizations, build, use_cache):
+    """
+    Compiles one file in a worker process, with `optimizations` the
+    {name: enabled} Compiler options. Returns (path, output, compile
+    seconds, build seconds, error), with error None on success.
+    """
+    backend = TARGETS[target]
+    output = output_path(path, base, output_dir, backend.EXTENSION)
+    start = time.perf_counter()
+    try:
+        with open(path, "r", encoding="utf-8") as src:
+            compiler = Compiler(src.read(), dialect=dialect, target=target, **optimizations)
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        # Streamed to a temporary file beside the output and renamed over
+        # it, so a compile error leaves any previous output untouched
+        temp_path = f"{output}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as out:
+                compiler.compile_to(out)
+            os.replace(temp_path, output)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    except Exception as e:
+        return path, output, time.perf_counter() - start, 0.0, f"Compilation Error: {e}"
+    compiled = time.perf_counter()
+
+    if build:
+        try:
+            cache = None
+            code = None
+            if use_cache:
+                # The cache is keyed by the code, so read back what was streamed out
+                cache = BuildCache()
+                with open(output, "r", encoding="utf-8") as f:
+                    code = f.read()
+            build_binary(code, output, os.path.splitext(output)[0], cache, backend.TOOLCHAIN)
+        except Exception as e:
+            return path, output, compiled - start, time.perf_counter() - compiled, f"Build Error: {e}"
+    return path, output, compiled - start, time.perf_counter() - compiled, None
+
+def main():
+    """Compiles every .skt file matched on the command line in parallel."""
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m sanskrit.batch",
+        description="Compile many .skt files in parallel.")
+    arg_parser.add_argument("sources", nargs="+",
+                            help=".skt files, directories to search, or glob patterns")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                            help="worker processes (default: %(default)s)")
+    arg_parser.add_argument("-o", "--output-dir",
+                            help="write outputs here, mirroring the input tree, "
+                                 "instead of next to each input")
+    arg_parser.add_argument("--dialect", choices=sorted(DIALECTS), default='function',
+                            help="language features to accept (default: %(default)s)")
+    arg_parser.add_argument("--target", choices=sorted(TARGETS), default='c++',
+                            help="language to generate (default: %(default)s)")
+    add_optimization_arguments(arg_parser)
+    arg_parser.add_argument("--build", action="store_true",
+                            help="also compile each output into a binary with gcc/g++")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="always rebuild binaries instead of reusing ~/.cache/sanskrit")
+    arg_parser.add_argument("-q", "--quiet", action="store_true",
+                            help="only report failures and the summary")
+    args = arg_parser.parse_args()
+    if args.jobs < 1:
+        arg_parser.error("--jobs must be at least 1")
+    if args.build and args.target == 'python':
+        arg_parser.error("--build needs the C or C++ target")
+
+    paths = find_sources(args.sources)
+    if not paths:
+        print("❌ No .skt files found.")
+        sys.exit(1)
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    paths = [os.path.abspath(path) for path in paths]
+
+    worker = partial(compile_file, base=base, output_dir=args.output_dir, dialect=args.dialect,
+                     target=args.target, optimizations=optimizations_from_args(args),
+                     build=args.build, use_cache=not args.no_cache)
+    jobs = min(args.jobs, len(paths))
+    # Hand out files in chunks so thousands of tiny programs do not each pay
+    # a round trip to a worker, while still leaving work to balance at the end.
+    chunksize = max(1, len(paths) // (jobs * 8))
+
+    print(f"📦 Compiling {len(paths)} files with {jobs} workers...")
+    start = time.perf_counter()
+    results = []
+    failures = []
+    if jobs == 1:
+        outcomes = map(worker, paths)
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        outcomes = executor.map(worker, paths, chunksize=chunksize)
+    for path, output, compile_time, build_time, error in outcomes:
+        name = os.path.relpath(path)
+        results.append((compile_time + build_time, name))
+        if error is not None:
+            failures.append(name)
+            print(f"❌ {name}: {error}")
+        elif not args.quiet:
+            timing = f"{compile_time * 1000:.2f} ms"
+            if args.build:
+                timing += f" + {build_time * 1000:.2f} ms build"
+            print(f"✅ {name} -> {os.path.relpath(output)} ({timing})")
+    if jobs > 1:
+        executor.shutdown()
+    elapsed = time.perf_counter() - start
+
+    print("--- Summary ---")
+    print(f"⏱️  {len(paths)} files in {elapsed:.2f} s ({len(paths) / elapsed:,.1f} files/sec), "
+          f"{len(paths) - len(failures)} succeeded, {len(failures)} failed.")
+    total = sum(seconds for seconds, _ in results)
+    print(f"   Per file: {total / len(results) * 1000:.2f} ms average, "
+          f"{total:.2f} s of work across {jobs} workers.")
+    for seconds, name in sorted(results, reverse=True)[:5]:
+        print(f"   {seconds * 1000:10.2f} ms  {name}")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+# =====================================================================
+# Build Cache
+# =====================================================================
+# Content-addressed store for generated C/C++ and compiled binaries, so an
+# unchanged program is never recompiled. Each entry is a directory named
+# by its key under ~/.cache/sanskrit/; once the cache grows past its size
+# limit the least recently used entries are evicted. The cache's size is
+# counted once per BuildCache and then kept up to date as entries are
+# written, so a store only scans the directory when it has to evict.
+
+CACHE_SIZE = 512 * 1024 * 1024
+
+# Command used to turn generated C++ into a binary
+CXX = ["g++"]
+
+_compiler_version = None
+
+def compiler_version():
+    """Fingerprint of this compiler's own source, so editing it invalidates old entries."""
+    global _compiler_version
+    if _compiler_version is None:
+        digest = hashlib.sha256()
+        package = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(package)):
+            if name.endswith(".py"):
+                with open(os.path.join(package, name), "rb") as f:
+                    digest.update(f.read())
+        _compiler_version = digest.hexdigest()
+    return _compiler_version
+
+class BuildCache:
+    def __init__(self, root=None, max_bytes=CACHE_SIZE):
+        if root is None:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+            root = os.path.join(base, "sanskrit")
+        self.root = root
+        self.max_bytes = max_bytes
+        self.total = None       # bytes stored, counted on first use
+
+    def size(self):
+        """Returns the bytes the cache holds, counting them the first time it is asked."""
+        if self.total is None:
+            self.total = sum(size for _, size, _ in self.entries())
+        return self.total
+
+    def entries(self):
+        """Returns (mtime, bytes, path) for every entry."""
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for key in os.listdir(self.root):
+            entry = os.path.join(self.root, key)
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+                entries.append((os.path.getmtime(entry), size, entry))
+            except OSError:
+                pass    # removed by another process meanwhile
+        return entries
+
+    def key(self, source, flags):
+        """Returns the entry key for a source text compiled with the given flags."""
+        digest = hashlib.sha256()
+        digest.update(compiler_version().encode())
+        digest.update(repr(sorted(flags.items())).encode())
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def lookup(self, key, name):
+        """Returns the path of a cached file, marking its entry as recently used."""
+        entry = os.path.join(self.root, key)
+        path = os.path.join(entry, name)
+        if not os.path.exists(path):
+            return None
+        os.utime(entry)
+        return path
+
+    def store(self, key, name, data, executable=False, evict=True):
+        """
+        Atomically writes `data` into an entry and returns the cached path.
+        Callers storing many entries at once pass evict=False and call
+        evict() when they are done.
+        """
+        total = self.size()
+        entry = os.path.join(self.root, key)
+        os.makedirs(entry, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=entry)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if executable:
+            os.chmod(temp_path, 0o755)
+        path = os.path.join(entry, name)
+        replaced = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(temp_path, path)
+        self.total = total + len(data) - replaced
+        if evict:
+            self.evict(keep=key)
+        return path
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used entries, other than `keep`, until the
+        cache fits in max_bytes. Does nothing while it already fits.
+        """
+        if self.size() <= self.max_bytes:
+            return
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        keep = os.path.join(self.root, keep) if keep is not None else None
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+        self.total = total
+
+def build_binary(cpp_code, cpp_path, output, cache=None, toolchain=CXX):
+    """
+    Compiles C or C++ into an executable at `output` with `toolchain`, reusing
+    a cached binary built from identical code. Returns True if the binary
+    came from the cache.
+    """
+    key = cache.key(cpp_code, {"cxx": toolchain}) if cache else None
+    cached = cache.lookup(key, "program") if cache else None
+    if cached is None:
+        result = subprocess.run(toolchain + [cpp_path, "-o", output], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(f"{toolchain[0]} failed:\n{result.stderr}")
+        if cache:
+            with open(output, "rb") as f:
+                cache.store(key, "program", f.read(), executable=True)
+        return False
+    shutil.copy2(cached, output)
+    return True
+
+def build_piped(compiler, output, language, toolchain=CXX, options=()):
+    """
+    Builds an executable at `output` from the code `compiler` generates,
+    streaming it into `toolchain` on stdin so it never touches the disk.
+    `language` is the toolchain's name for it ('c' or 'c++'). Returns the
+    seconds spent generating code; the rest was the toolchain's.
+    """
+    # The toolchain's diagnostics go to a file: a full stderr pipe would
+    # stall it while we are still writing to its stdin.
+    with tempfile.TemporaryFile() as errors:
+        process = subprocess.Popen(toolchain + ["-x", language, "-", "-o", output, *options],
+                                   stdin=subprocess.PIPE, stderr=errors, encoding="utf-8")
+        start = time.perf_counter()
+        try:
+            compiler.compile_to(process.stdin)
+            generated = time.perf_counter() - start
+            process.stdin.close()
+        except BrokenPipeError:
+            generated = time.perf_counter() - start    # it stopped reading; its errors say why
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        if process.wait() != 0:
+            errors.seek(0)
+            raise Exception(f"{toolchain[0]} failed:\n{errors.read().decode('utf-8', 'replace')}")
+    return generated
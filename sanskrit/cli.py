@@ -0,0 +1,382 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import nullcontext
+
+from .backend import TARGETS
+from .cache import CXX, BuildCache, build_binary, build_piped
+from .compiler import Compiler
+from .incremental import IncrementalCompiler, build_units, write_units
+from .optimize import MEMO_SIZE, add_optimization_arguments, optimizations_from_args
+from .parser import DIALECTS
+from .pyexec import build_code, run_code
+from .shared import SharedLibrary, build_shared
+from .timings import PhaseTimer
+from .vm import VirtualMachine
+
+# =====================================================================
+# Main Driver
+# =====================================================================
+
+def run_program(code, optimizations, memoize=False, memo_size=None, dialect='function',
+                timer=None):
+    """
+    Compiles and runs a program in-process, reporting the time taken.
+    `optimizations` are the {name: enabled} Compiler options.
+    """
+    start = time.perf_counter()
+    try:
+        functions = Compiler(code, memoize=memoize, memo_size=memo_size, dialect=dialect,
+                             timer=timer, **optimizations).compile_bytecode()
+    except Exception as e:
+        print(f"❌ Compilation Error: {e}")
+        sys.exit(1)
+    compiled = time.perf_counter()
+
+    print("--- Program Output ---")
+    try:
+        with timer.phase('run') if timer is not None else nullcontext():
+            exit_code = VirtualMachine(functions).run()
+    except Exception as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finished = time.perf_counter()
+    print("----------------------")
+    print(f"⏱️  Compiled in {(compiled - start) * 1000:.2f} ms, "
+          f"ran in {(finished - compiled) * 1000:.2f} ms (exit code {exit_code}).")
+    for func in functions:
+        if func.memo is not None:
+            print(f"🧠 Memoized '{func.name}': {func.hits} hits, {func.misses} misses.")
+
+def run_native(code, backend, flags, opt, cache=None):
+    """
+    Builds a program with the local toolchain, piping the generated code in
+    on stdin, and runs it with its output going straight to the terminal.
+    Binaries are cached per source and flags, so an unchanged program only
+    pays for the run.
+    """
+    options = [f"-O{opt}"]
+    key = cache.key(code, dict(flags, unit="run", toolchain=backend.TOOLCHAIN, options=options)) \
+        if cache else None
+    binary = cache.lookup(key, "program") if cache else None
+    with tempfile.TemporaryDirectory(prefix="sanskrit-") as directory:
+        start = time.perf_counter()
+        if binary is None:
+            output = os.path.join(directory, "program")
+            compiler = Compiler(code, **flags)
+            try:
+                generated = build_piped(compiler, output, backend.LANGUAGE, backend.TOOLCHAIN, options)
+            except Exception as e:
+                print(f"❌ Build Error: {e}")
+                sys.exit(1)
+            built = time.perf_counter() - start
+            summary = (f"Built in {built * 1000:.2f} ms ({generated * 1000:.2f} ms generating "
+                       f"{backend.NAME}, the rest in {backend.TOOLCHAIN[0]} {' '.join(options)})")
+            if cache:
+                with open(output, "rb") as f:
+                    binary = cache.store(key, "program", f.read(), executable=True)
+            else:
+                binary = output
+        else:
+            summary = f"Reused cached binary in {(time.perf_counter() - start) * 1000:.2f} ms"
+
+        print("--- Program Output ---", flush=True)
+        start = time.perf_counter()
+        exit_code = subprocess.run([binary]).returncode
+        finished = time.perf_counter()
+    print("----------------------")
+    print(f"⏱️  {summary}, ran in {(finished - start) * 1000:.2f} ms (exit code {exit_code}).")
+
+def run_python(code, flags, cache=None):
+    """
+    Runs a program in-process as Python, reusing the code object cached for
+    an unchanged source and flags, so only the first run pays for compiling.
+    """
+    start = time.perf_counter()
+    try:
+        program, from_cache = build_code(code, flags, cache)
+    except Exception as e:
+        print(f"❌ Compilation Error: {e}")
+        sys.exit(1)
+    loaded = time.perf_counter()
+
+    print("--- Program Output ---", flush=True)
+    try:
+        exit_code, namespace = run_code(program)
+    except Exception as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finished = time.perf_counter()
+    print("----------------------")
+    summary = "Loaded cached code object" if from_cache else "Compiled to Python"
+    print(f"⏱️  {summary} in {(loaded - start) * 1000:.2f} ms, "
+          f"ran in {(finished - loaded) * 1000:.2f} ms (exit code {exit_code}).")
+    for name, value in namespace.items():
+        if name.startswith("f_") and hasattr(value, "cache_info"):
+            info = value.cache_info()
+            print(f"🧠 Memoized '{name[2:]}': {info.hits} hits, {info.misses} misses.")
+
+def run_shared(code, flags, opt, cache=None):
+    """
+    Builds a program as a shared library, loads it into this process and
+    calls its main, printing what लेखय captured.
+    """
+    with tempfile.TemporaryDirectory(prefix="sanskrit-") as directory:
+        path = os.path.join(directory, "program.so")
+        start = time.perf_counter()
+        try:
+            from_cache = build_shared(code, flags, path, cache, opt)
+        except Exception as e:
+            print(f"❌ Build Error: {e}")
+            sys.exit(1)
+        built = time.perf_counter()
+        library = SharedLibrary(path)
+        loaded = time.perf_counter()
+        try:
+            exit_code = library.call('main')
+        except Exception as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        finished = time.perf_counter()
+    print("--- Program Output ---")
+    print(library.output(), end="")
+    print("----------------------")
+    summary = "Reused cached library" if from_cache else f"Built with {CXX[0]} -O{opt}"
+    print(f"⏱️  {summary} in {(built - start) * 1000:.2f} ms, loaded in {(loaded - built) * 1000:.2f} ms, "
+          f"ran in {(finished - loaded) * 1000:.3f} ms (exit code {exit_code}).")
+
+def write_shared(code, flags, opt, cache=None):
+    """Builds ./program.so and shows how to call its functions from Python."""
+    start = time.perf_counter()
+    try:
+        from_cache = build_shared(code, flags, "program.so", cache, opt)
+    except Exception as e:
+        print(f"❌ Build Error: {e}")
+        sys.exit(1)
+    source = "reused cached library" if from_cache else f"built with {CXX[0]} -O{opt}"
+    print(f"\n✅ Shared library 'program.so' {source} in {(time.perf_counter() - start) * 1000:.2f} ms.")
+    library = SharedLibrary("program.so")
+    if not library.exported:
+        print("❌ program.skt defines no functions to call.")
+        sys.exit(1)
+    print("📚 Exported functions:")
+    for name, spelling, arity in library.exported:
+        print(f"   {name} ({arity} int arguments) as sanskrit_entry_{spelling}")
+    example, _, arity = library.exported[0]
+    args = "".join(f", {index + 1}" for index in range(arity))
+    print("To call them from Python, with लेखय output captured per thread:")
+    print("\n  from sanskrit.shared import SharedLibrary")
+    print('  library = SharedLibrary("program.so")')
+    print(f'  library.call("{example}"{args}); library.output()\n')
+
+def report_timings(timer, json_path):
+    """Prints the phase timings and writes them as JSON if requested."""
+    if timer is None:
+        return
+    timer.print_report()
+    if json_path:
+        timer.write_json(json_path)
+        if json_path != "-":
+            print(f"📊 Timings written to '{json_path}'.")
+
+def main(sample=None, dialect='function', target='c++'):
+    """
+    Compiles program.skt in the current directory. The per-directory scripts
+    pass their own sample program (written to program.skt first) and the
+    dialect and target they have always used.
+    """
+    arg_parser = argparse.ArgumentParser(description="Compile program.skt to C, C++ or Python.")
+    arg_parser.add_argument("command", nargs="?", choices=["run"],
+                            help="run: build with gcc/g++ (code piped in, nothing written "
+                                 "here) and run the program; with --target python, run it "
+                                 "in-process from a cached code object")
+    arg_parser.add_argument("--dialect", choices=sorted(DIALECTS), default=dialect,
+                            help="language features to accept (default: %(default)s)")
+    arg_parser.add_argument("--target", choices=sorted(TARGETS), default=target,
+                            help="language to generate (default: %(default)s)")
+    add_optimization_arguments(arg_parser)
+    arg_parser.add_argument("--run", action="store_true",
+                            help="run the program in-process on the bytecode VM instead of writing C/C++")
+    arg_parser.add_argument("-O", dest="opt", choices=["0", "1", "2", "3", "s"], default="2",
+                            help="gcc/g++ optimization level for the run command and --shared "
+                                 "(default: %(default)s)")
+    arg_parser.add_argument("--memoize", action="store_true",
+                            help="cache the results of pure functions (C++ and Python only)")
+    arg_parser.add_argument("--memo-size", type=int, default=MEMO_SIZE,
+                            help="entries kept per memoized function (default: %(default)s)")
+    arg_parser.add_argument("--stdout", action="store_true",
+                            help="stream the generated code to stdout as it is produced, and "
+                                 "print nothing else (e.g. | g++ -x c++ - -o program)")
+    arg_parser.add_argument("--shared", action="store_true",
+                            help="build ./program.so with g++ instead, for calling functions from "
+                                 "Python through ctypes (sanskrit.shared); with run, load it "
+                                 "in-process and call main")
+    arg_parser.add_argument("--build", action="store_true",
+                            help="also compile the output into ./program with gcc/g++")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="always recompile instead of reusing ~/.cache/sanskrit")
+    arg_parser.add_argument("--split", action="store_true",
+                            help="also write one file per function to program_units/ so "
+                                 "--build recompiles only the functions that changed")
+    arg_parser.add_argument("--timings", action="store_true",
+                            help="report the wall time of each compiler phase (bypasses the cache)")
+    arg_parser.add_argument("--profile", action="store_true",
+                            help="like --timings, also tracing the memory each phase allocates")
+    arg_parser.add_argument("--timings-json", metavar="PATH",
+                            help="write the phase report as JSON to PATH ('-' for stdout)")
+    args = arg_parser.parse_args()
+    timer = None
+    if args.timings or args.profile or args.timings_json:
+        timer = PhaseTimer(allocations=args.profile)
+        if args.split:
+            arg_parser.error("--split cannot be combined with --timings or --profile")
+    if args.split and (args.memoize or args.no_cache):
+        arg_parser.error("--split cannot be combined with --memoize or --no-cache")
+    if args.split and args.dialect != 'function':
+        arg_parser.error("--split needs the function dialect")
+    if args.memoize and args.target == 'c':
+        arg_parser.error("--memoize needs the C++ or Python target")
+    if args.target == 'python' and (args.build or args.split):
+        arg_parser.error("--build and --split need the C or C++ target")
+    if args.shared and (args.target != 'c++' or args.memoize):
+        arg_parser.error("--shared needs the C++ target without --memoize")
+    if args.shared and (args.run or args.stdout or args.build or args.split or timer):
+        arg_parser.error("--shared cannot be combined with --run, --stdout, --build, --split or timings")
+    if args.stdout and (args.run or args.build or args.split or timer):
+        arg_parser.error("--stdout cannot be combined with --run, --build, --split or timings")
+    if args.command == "run" and (args.run or args.stdout or args.build or args.split or timer):
+        arg_parser.error("run cannot be combined with --run, --stdout, --build, --split or timings")
+
+    backend = TARGETS[args.target]
+    output_path = "program" + backend.EXTENSION
+
+    if sample is not None:
+        with open("program.skt", "w", encoding="utf-8") as f:
+            f.write(sample)
+        if not args.stdout:
+            print("📜 Created sample 'program.skt'.")
+
+    # Read the source file
+    try:
+        with open("program.skt", "r", encoding="utf-8") as src:
+            code = src.read()
+    except FileNotFoundError:
+        print("Error: 'program.skt' not found. Please create it.")
+        sys.exit(1)
+
+    optimizations = optimizations_from_args(args)
+    # Everything the generated code depends on, as Compiler keyword arguments
+    flags = dict(optimizations, memoize=args.memoize, memo_size=args.memo_size,
+                 dialect=args.dialect, target=args.target)
+    if args.command == "run":
+        cache = None if args.no_cache else BuildCache()
+        if args.shared:
+            run_shared(code, flags, args.opt, cache)
+        elif args.target == 'python':
+            run_python(code, flags, cache)
+        else:
+            run_native(code, backend, flags, args.opt, cache)
+        return
+
+    if args.shared:
+        write_shared(code, flags, args.opt, None if args.no_cache else BuildCache())
+        return
+
+    if args.stdout:
+        try:
+            Compiler(code, **flags).compile_to(sys.stdout)
+        except Exception as e:
+            print(f"❌ Compilation Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.stdout.write("\n")
+        return
+
+    if args.run:
+        run_program(code, optimizations, memoize=args.memoize, memo_size=args.memo_size,
+                    dialect=args.dialect, timer=timer)
+        report_timings(timer, args.timings_json)
+        return
+
+    # Reuse the output of an earlier compile of the same source and flags
+    start = time.perf_counter()
+    # Timed runs always compile from scratch so every phase is measured
+    cache = None if args.no_cache or timer else BuildCache()
+    cache_key = cache.key(code, flags) if cache else None
+    cached = cache.lookup(cache_key, output_path) if cache else None
+
+    compiler = None
+    if cached is not None and not args.split:
+        with open(cached, "r", encoding="utf-8") as f:
+            cpp_code = f.read()
+    else:
+        # Compile the code, reusing the C++ of unchanged functions when possible
+        try:
+            if cache and not args.memoize:
+                compiler = IncrementalCompiler(code, cache, dialect=args.dialect,
+                                               target=args.target, **optimizations)
+            else:
+                compiler = Compiler(code, timer=timer, **flags)
+            cpp_code = compiler.compile()
+        except Exception as e:
+            print(f"❌ Compilation Error: {e}")
+            sys.exit(1)
+        if cache:
+            cache.store(cache_key, output_path, cpp_code.encode("utf-8"))
+
+    # Write the output file
+    with timer.phase('write') if timer else nullcontext():
+        with open(output_path, "w", encoding="utf-8") as out:
+            out.write(cpp_code)
+
+    print(f"\n✅ Compilation complete! {backend.NAME} code written to '{output_path}'.")
+    if compiler is None:
+        elapsed = time.perf_counter() - start
+        print(f"♻️  Unchanged source: reused cached {backend.NAME} in {elapsed * 1000:.2f} ms.")
+    else:
+        if isinstance(compiler, IncrementalCompiler) and compiler.reused:
+            print(f"♻️  Reused cached {backend.NAME} for {compiler.reused} of "
+                  f"{len(compiler.units)} functions (unchanged).")
+        if compiler.folder is not None:
+            print(f"🔧 Constant folding: {compiler.folder.folded} expressions folded, "
+                  f"{compiler.folder.propagated} variable uses propagated.")
+        if compiler.eliminator is not None and compiler.eliminator.dropped:
+            print(f"🧹 Dead code: {compiler.eliminator.removed} statements removed.")
+            for function, description in compiler.eliminator.dropped:
+                print(f"   {function}: {description}")
+        if compiler.hoister is not None and compiler.hoister.hoisted:
+            print(f"🏗️  Loop-invariant code motion: {compiler.hoister.hoisted} computations "
+                  f"moved out of loops.")
+        if compiler.memoized:
+            counts = " (hit/miss counts are printed to stderr on exit)" if args.target == 'c++' else ""
+            print(f"🧠 Memoized pure functions: {', '.join(sorted(compiler.memoized))}{counts}.")
+
+    unit_paths = None
+    if args.split:
+        unit_paths = write_units(compiler.units, "program_units", backend)
+        print(f"🧩 Wrote {len(unit_paths)} per-function units to 'program_units/'.")
+
+    if args.build:
+        start = time.perf_counter()
+        try:
+            if unit_paths is not None:
+                rebuilt = build_units(unit_paths, "program_units", "program", backend.TOOLCHAIN)
+                source = f"linked after recompiling {rebuilt} of {len(unit_paths)} units"
+            else:
+                with timer.phase(backend.TOOLCHAIN[0]) if timer else nullcontext():
+                    from_cache = build_binary(cpp_code, output_path, "program", cache, backend.TOOLCHAIN)
+                source = "reused cached binary" if from_cache else f"built with {backend.TOOLCHAIN[0]}"
+        except Exception as e:
+            print(f"❌ Build Error: {e}")
+            sys.exit(1)
+        print(f"🔨 'program' {source} in {(time.perf_counter() - start) * 1000:.2f} ms. Run it with:")
+        print("\n  ./program\n")
+    else:
+        print("To run the compiled program, execute the following commands:")
+        print(f"\n  {backend.RUN.format(toolchain=backend.TOOLCHAIN[0], path=output_path)}\n")
+    print(f"--- Generated {backend.NAME} Code ---")
+    print(cpp_code)
+    print("--------------------------")
+    report_timings(timer, args.timings_json)
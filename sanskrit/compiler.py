@@ -0,0 +1,104 @@
+from contextlib import nullcontext
+
+from .backend import TARGETS, SharedBackend
+from .ir import Lowering
+from .lexer import Lexer
+from .optimize import ConstantFolder, DeadCodeEliminator, LoopInvariantMotion, pure_functions
+from .parser import Parser
+from .timings import count_statements
+from .vm import BytecodeCompiler
+
+# =====================================================================
+# Compiler
+# =====================================================================
+# Ties the stages together: source -> AST -> IR -> C, C++ or bytecode.
+
+class Compiler:
+    def __init__(self, source_code, fold=True, dce=True, licm=True, memoize=False, memo_size=None,
+                 dialect='function', target='c++', timer=None, shared=False):
+        if target not in TARGETS:
+            raise Exception(f"Unknown target: '{target}'")
+        if memoize and target == 'c':
+            raise Exception("Memoization needs the C++ or Python target")
+        if shared and (target != 'c++' or memoize):
+            raise Exception("A shared library needs the C++ target without memoization")
+        self.timer = timer      # PhaseTimer recording each stage, if any
+        if timer is None:
+            self.parser = Parser(source_code, dialect=dialect)
+        else:
+            # Scan everything up front so lexing and parsing are timed apart
+            with timer.phase('lex'):
+                tokens = list(Lexer(source_code).tokenize())
+            timer.count('tokens', len(tokens) - 1)
+            self.parser = Parser(None, tokens=iter(tokens), dialect=dialect)
+        # shared: C++ for a library loaded with ctypes instead of a program
+        self.backend = SharedBackend if shared else TARGETS[target]
+        self.folder = ConstantFolder() if fold else None
+        self.eliminator = DeadCodeEliminator() if dce else None
+        self.hoister = LoopInvariantMotion() if licm else None
+        self.memoize = memoize
+        self.memo_size = memo_size
+        self.memoized = set()   # pure functions given a memo cache by build()
+
+    def phase(self, name):
+        """Context manager timing one stage when a timer is attached."""
+        return self.timer.phase(name) if self.timer is not None else nullcontext()
+
+    def parse(self):
+        """Returns the AST for the source."""
+        with self.phase('parse'):
+            program = self.parser.parse_program()
+        if self.timer is not None:
+            self.timer.count('functions', len(program.functions))
+            self.timer.count('statements', sum(count_statements(func.body)
+                                               for func in program.functions))
+        return program
+
+    def lower(self, program):
+        """Returns the IR for an AST."""
+        with self.phase('lower'):
+            return Lowering().lower_program(program)
+
+    def optimize(self, program):
+        """Runs the enabled optimization passes over an IR program."""
+        if self.folder is not None:
+            with self.phase('optimize:fold'):
+                program = self.folder.run(program)
+        if self.eliminator is not None:
+            # After folding, so conditions it made constant and reads it
+            # replaced with values count
+            with self.phase('optimize:dce'):
+                program = self.eliminator.run(program)
+        if self.hoister is not None:
+            with self.phase('optimize:licm'):
+                program = self.hoister.run(program)
+        return program
+
+    def build(self):
+        """Returns the optimized IR for the source."""
+        program = self.optimize(self.lower(self.parse()))
+        if self.memoize:
+            with self.phase('analyze:purity'):
+                self.memoized = pure_functions(program)
+        return program
+
+    def compile(self):
+        """Main compilation method."""
+        program = self.build()
+        with self.phase('emit'):
+            return self.backend(self.memoized, self.memo_size).emit(program)
+
+    def compile_to(self, sink):
+        """
+        Like compile(), but writes the code to a text sink (an open file,
+        sys.stdout, a pipe) as it is generated instead of returning it.
+        """
+        program = self.build()
+        with self.phase('emit'):
+            self.backend(self.memoized, self.memo_size, sink).stream(program)
+
+    def compile_bytecode(self):
+        """Compiles the source for the in-process VirtualMachine."""
+        program = self.build()
+        with self.phase('bytecode'):
+            return BytecodeCompiler(program, self.memoized, self.memo_size).compile()
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+from collections import OrderedDict, deque
+
+from .backend import TARGETS
+from .compiler import Compiler
+from .optimize import OPTIMIZATIONS, add_optimization_arguments, optimizations_from_args
+from .parser import DIALECTS
+
+# =====================================================================
+# Compile Server
+# =====================================================================
+# A long-lived process that keeps the compiler imported and warm, so a
+# compile costs a socket round trip instead of a Python start-up. Requests
+# and responses are single-line JSON objects over a Unix domain socket;
+# a client may send any number of requests on one connection.
+#
+#   {"source": "...", "dialect": "function", "target": "c++", "fold": true, "dce": true,
+#    "licm": true}
+#       -> {"ok": true, "code": "...", "ms": 0.41, "cached": false}
+#   {"command": "stats"}     -> {"ok": true, "stats": {...}}
+#   {"command": "shutdown"}  -> {"ok": true}
+
+# Compiled outputs kept in memory, keyed by source and options
+RESULT_CACHE_SIZE = 256
+
+# Per-request latencies kept for the percentile report
+LATENCY_WINDOW = 10_000
+
+# Longest request line accepted; asyncio's default of 64 KiB is smaller
+# than a large program
+REQUEST_LIMIT = 64 * 1024 * 1024
+
+def default_socket_path():
+    """Returns a per-user socket path, preferring $XDG_RUNTIME_DIR."""
+    base = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(base, f"sanskrit-{os.getuid()}.sock")
+
+class CompileServer:
+    def __init__(self, path, cache_size=RESULT_CACHE_SIZE):
+        self.path = path
+        self.results = OrderedDict()    # least recently used first
+        self.cache_size = cache_size
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.requests = 0
+        self.errors = 0
+        self.hits = 0
+        self.started = time.time()
+        self.server = None
+
+    async def compile(self, request):
+        """
+        Answers one compile request, reusing the result for a repeated
+        source. The compile itself runs on the event loop's thread pool, so
+        a large program does not stall other clients; the result cache and
+        counters are only touched from the loop.
+        """
+        dialect = request.get("dialect", "function")
+        target = request.get("target", "c++")
+        optimizations = {name: request.get(name, True) for name in OPTIMIZATIONS}
+        key = (request["source"], dialect, target, *optimizations.values())
+        code = self.results.get(key)
+        if code is not None:
+            self.results.move_to_end(key)
+            self.hits += 1
+            return {"ok": True, "code": code, "cached": True}
+        compiler = Compiler(request["source"], dialect=dialect, target=target, **optimizations)
+        code = await asyncio.get_running_loop().run_in_executor(None, compiler.compile)
+        self.results[key] = code
+        if len(self.results) > self.cache_size:
+            self.results.popitem(last=False)
+        return {"ok": True, "code": code, "cached": False}
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "cache_hits": self.hits,
+            "uptime_s": round(time.time() - self.started, 1),
+            "mean_ms": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "p50_ms": round(percentile(0.50), 3),
+            "p95_ms": round(percentile(0.95), 3),
+            "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+        }
+
+    async def handle(self, request):
+        """Returns the response for one decoded request."""
+        command = request.get("command", "compile")
+        if command == "stats":
+            return {"ok": True, "stats": self.stats()}
+        if command == "shutdown":
+            self.server.close()
+            return {"ok": True}
+        if command != "compile":
+            raise Exception(f"Unknown command: '{command}'")
+
+        start = time.perf_counter()
+        self.requests += 1
+        try:
+            response = await self.compile(request)
+        except Exception as e:
+            self.errors += 1
+            response = {"ok": False, "error": str(e)}
+        elapsed = (time.perf_counter() - start) * 1000
+        self.latencies.append(elapsed)
+        response["ms"] = round(elapsed, 3)
+        return response
+
+    async def connection(self, reader, writer):
+        # Connections are served concurrently; compiles run off the loop,
+        # so stats and cached results are answered while one is in progress.
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.server = await asyncio.start_unix_server(self.connection, path=self.path,
+                                                      limit=REQUEST_LIMIT)
+        os.chmod(self.path, 0o600)
+        print(f"🛰️  Compile server listening on {self.path}")
+        try:
+            async with self.server:
+                await self.server.wait_closed()
+        finally:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+class CompileClient:
+    """Blocking client for a CompileServer; one connection serves many requests."""
+    def __init__(self, path=None):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path or default_socket_path())
+        self.reader = self.socket.makefile("rb")
+
+    def request(self, **fields):
+        self.socket.sendall(json.dumps(fields, ensure_ascii=False).encode("utf-8") + b"\n")
+        response = json.loads(self.reader.readline())
+        if not response["ok"]:
+            raise Exception(response["error"])
+        return response
+
+    def compile(self, source, dialect="function", target="c++", **optimizations):
+        return self.request(source=source, dialect=dialect, target=target, **optimizations)
+
+    def close(self):
+        self.reader.close()
+        self.socket.close()
+
+def main():
+    """Starts the server, or acts as its client."""
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m sanskrit.daemon",
+        description="Keep a compiler warm behind a Unix socket.")
+    arg_parser.add_argument("--socket", default=default_socket_path(),
+                            help="socket path (default: %(default)s)")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the compile server in the foreground")
+    compile_parser = commands.add_parser("compile", help="compile .skt files through the server")
+    compile_parser.add_argument("sources", nargs="+", help=".skt files to compile")
+    compile_parser.add_argument("--dialect", choices=sorted(DIALECTS), default='function')
+    compile_parser.add_argument("--target", choices=sorted(TARGETS), default='c++')
+    add_optimization_arguments(compile_parser)
+    commands.add_parser("stats", help="print the server's request and latency counters")
+    commands.add_parser("stop", help="shut the server down")
+    args = arg_parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(CompileServer(args.socket).serve())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    try:
+        client = CompileClient(args.socket)
+    except OSError as e:
+        print(f"❌ No compile server at {args.socket} ({e.strerror}). "
+              f"Start one with: python -m sanskrit.daemon serve")
+        sys.exit(1)
+
+    if args.command == "stats":
+        print(json.dumps(client.request(command="stats")["stats"], indent=2))
+    elif args.command == "stop":
+        client.request(command="shutdown")
+        print("🛑 Compile server stopped.")
+    else:
+        failed = False
+        extension = TARGETS[args.target].EXTENSION
+        for path in args.sources:
+            start = time.perf_counter()
+            try:
+                with open(path, "r", encoding="utf-8") as src:
+                    response = client.compile(src.read(), args.dialect, args.target,
+                                              **optimizations_from_args(args))
+            except Exception as e:
+                print(f"❌ {path}: {e}")
+                failed = True
+                continue
+            output = os.path.splitext(path)[0] + extension
+            with open(output, "w", encoding="utf-8") as out:
+                out.write(response["code"])
+            round_trip = (time.perf_counter() - start) * 1000
+            print(f"✅ {path} -> {output} (server {response['ms']:.2f} ms, "
+                  f"round trip {round_trip:.2f} ms)")
+        if failed:
+            sys.exit(1)
+    client.close()
+
+if __name__ == "__main__":
+    main()
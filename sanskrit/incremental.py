@@ -0,0 +1,211 @@
+import os
+import subprocess
+
+from .backend import CppBackend, TARGETS
+from .cache import CXX
+from .compiler import Compiler
+from .ir import IRProgram, Lowering
+from .lexer import Lexer, Token, TT_EOF, TT_IDENTIFIER, TT_KEYWORD, TT_LBRACE, TT_RBRACE, TT_RPAREN
+from .optimize import ConstantFolder, DeadCodeEliminator, LoopInvariantMotion
+from .parser import Parser
+
+# =====================================================================
+# Incremental Compilation
+# =====================================================================
+# Recompiles only the function definitions that changed. The source is
+# split into functions with a cheap token scan, and each function's C++
+# is cached under a hash of its tokens plus everything outside it that
+# its output depends on.
+
+def split_functions(tokens):
+    """
+    Splits a token stream into one token list per top-level function
+    definition, each terminated by EOF. Returns None if the source is not
+    a plain sequence of definitions, leaving the full parser to report it.
+    """
+    functions = []
+    current = None
+    depth = 0
+    for token in tokens:
+        if token.type == TT_EOF:
+            break
+        if current is None:
+            if token.type != TT_KEYWORD or token.value != 'कार्यम्':
+                return None
+            current = []
+        current.append(token)
+        if token.type == TT_LBRACE:
+            depth += 1
+        elif token.type == TT_RBRACE:
+            depth -= 1
+            if depth == 0:
+                current.append(Token(TT_EOF, None))
+                functions.append(current)
+                current = None
+    return functions if current is None else None
+
+def function_bindings(tokens, names):
+    """
+    Binds the names a function's tokens introduce in `names`, a Lowering
+    shared by the whole program, in the order the full compiler binds
+    them. Returns the C spelling of the function, and of each of its
+    parameters and variables.
+    """
+    name = tokens[1].value
+    spelling = names._bind_function(name, 'main' if name == 'मुख्य' else None)
+    bindings = {}
+    in_params = True
+    for index, token in enumerate(tokens[3:], 3):
+        if in_params:
+            if token.type == TT_RPAREN:
+                in_params = False
+            elif token.type == TT_IDENTIFIER:
+                bindings[token.value] = names._bind(token.value)
+        elif token.type == TT_KEYWORD and token.value == 'स्थापय' and \
+                tokens[index + 1].type == TT_IDENTIFIER:
+            target = tokens[index + 1].value
+            bindings[target] = names._bind(target)
+    return spelling, bindings
+
+class IncrementalCompiler:
+    """
+    Produces the same code as Compiler, but reuses the cached translation of
+    every function whose tokens and external name bindings are unchanged.
+    """
+    def __init__(self, source_code, cache, fold=True, dce=True, licm=True, dialect='function',
+                 target='c++'):
+        self.source_code = source_code
+        self.cache = cache
+        self.optimizations = {"fold": fold, "dce": dce, "licm": licm}
+        self.dialect = dialect
+        self.target = target
+        self.backend = TARGETS[target]
+        self.folder = ConstantFolder() if fold else None
+        self.eliminator = DeadCodeEliminator() if dce else None
+        self.hoister = LoopInvariantMotion() if licm else None
+        self.memoized = set()
+        self.units = []       # (C function name, C++ text) in definition order
+        self.reused = 0
+
+    def compile_function(self, tokens, known_names, known_functions, bindings):
+        """
+        Translates one function's tokens to C++ with earlier names already
+        bound and the names it binds itself given their program-wide spelling.
+        """
+        parser = Parser(None, tokens=iter(tokens))
+        func = parser.parse_function_definition()
+        lowering = Lowering(bindings)
+        lowering.translit_map.update(known_names)
+        lowering.function_map.update(known_functions)
+        program = IRProgram([lowering.lower_function(func)])
+        if self.folder is not None:
+            self.folder.run(program)
+        if self.eliminator is not None:
+            self.eliminator.run(program)
+        if self.hoister is not None:
+            self.hoister.run(program)
+        backend = self.backend()
+        backend.function(program.functions[0])
+        return program.functions[0].name, backend.sink.getvalue()
+
+    def compile(self):
+        """Main compilation method."""
+        functions = None
+        # The Python backend checks every call against the whole program's
+        # functions as it writes the module, which cached units would skip
+        if self.dialect == 'function' and self.target != 'python':
+            functions = split_functions(Lexer(self.source_code).tokenize())
+        if functions is None:
+            # A single main, a Python module, or a source the full compiler
+            # should report on
+            return Compiler(self.source_code, dialect=self.dialect, target=self.target,
+                            **self.optimizations).compile()
+
+        # Names are resolved in source order, so a function's output depends
+        # on which of the names it mentions earlier functions had bound.
+        # Colliding spellings are told apart program-wide, so the names a
+        # function binds are spelled up front with the rest of the program.
+        names = Lowering()
+        for tokens in functions:
+            mentioned = {token.value for token in tokens if token.type == TT_IDENTIFIER}
+            known_names = {name: names.translit_map[name] for name in mentioned
+                           if name in names.translit_map}
+            known_functions = {name: names.function_map[name] for name in mentioned
+                               if name in names.function_map}
+            spelling, bindings = function_bindings(tokens, names)
+            known_functions[tokens[1].value] = spelling
+            fingerprint = "\x00".join(f"{token.type}:{token.value}" for token in tokens)
+            key = self.cache.key(fingerprint, dict(self.optimizations, unit="function",
+                                                   target=self.target,
+                                                   known=sorted(known_names.items()),
+                                                   functions=sorted(known_functions.items()),
+                                                   binds=sorted(bindings.items())))
+            cached = self.cache.lookup(key, "function.cpp")
+            if cached is not None:
+                with open(cached, "r", encoding="utf-8") as f:
+                    name, cpp = f.read().split("\n", 1)
+                self.reused += 1
+            else:
+                name, cpp = self.compile_function(tokens, known_names, known_functions, bindings)
+                self.cache.store(key, "function.cpp", f"{name}\n{cpp}".encode("utf-8"),
+                                 evict=False)
+            self.units.append((name, cpp))
+        # Evicted once for the whole program rather than after every function
+        self.cache.evict()
+
+        backend = self.backend()
+        return "\n".join(backend.header() + [cpp for _, cpp in self.units] + backend.footer())
+
+def _write_if_changed(path, text):
+    """Writes a file only when its content differs, so its mtime tracks real changes."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return
+    except FileNotFoundError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def write_units(units, directory, backend=CppBackend):
+    """
+    Writes one source file per function plus a shared header of prototypes,
+    removing units left over from functions that no longer exist. Returns
+    the paths of the source files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    prototypes = []
+    paths = []
+    for name, cpp in units:
+        prototypes.append(cpp.split("\n", 1)[0][:-2] + ";")   # "int f(int a) {" -> "int f(int a);"
+        path = os.path.join(directory, name + backend.EXTENSION)
+        _write_if_changed(path, f'#include "program.h"\n\n{cpp}')
+        paths.append(path)
+    header = ["#pragma once"] + backend().header() + prototypes
+    _write_if_changed(os.path.join(directory, "program.h"), "\n".join(header) + "\n")
+
+    for name in os.listdir(directory):
+        stem, ext = os.path.splitext(name)
+        if ext in (backend.EXTENSION, ".o") and \
+                os.path.join(directory, stem + backend.EXTENSION) not in paths:
+            os.remove(os.path.join(directory, name))
+    return paths
+
+def build_units(paths, directory, output, toolchain=CXX):
+    """Compiles only the units newer than their object files, then links. Returns the rebuilt count."""
+    header_time = os.path.getmtime(os.path.join(directory, "program.h"))
+    objects = []
+    rebuilt = 0
+    for path in paths:
+        obj = os.path.splitext(path)[0] + ".o"
+        objects.append(obj)
+        if os.path.exists(obj) and os.path.getmtime(obj) >= max(os.path.getmtime(path), header_time):
+            continue
+        result = subprocess.run(toolchain + ["-c", path, "-o", obj], capture_output=True, text=True)
+        if result.returncode != 0:
+            raise Exception(f"{toolchain[0]} failed:\n{result.stderr}")
+        rebuilt += 1
+    result = subprocess.run(toolchain + objects + ["-o", output], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"{toolchain[0]} failed:\n{result.stderr}")
+    return rebuilt
@@ -0,0 +1,269 @@
+import re
+from functools import lru_cache
+
+from .nodes import Assign, BinaryOp, Call, If, Name, Node, Number, Print, Return, UnaryOp, While, \
+    walk_postorder
+from .symbols import SymbolTable
+
+# =====================================================================
+# Intermediate Representation
+# =====================================================================
+# The AST lowered for code generation: every name is resolved to its
+# C-safe spelling and each assignment is marked as a declaration or a
+# store. Optimization passes and backends work on this form.
+
+class IRProgram(Node):
+    __slots__ = ('functions',)
+
+class IRFunction(Node):
+    __slots__ = ('name', 'params', 'body', 'symbols')   # symbols: its own, then those declared inside it
+
+class IRDeclare(Node):     # first assignment of a variable in its scope
+    __slots__ = ('name', 'value')
+
+class IRStore(Node):       # assignment to an already declared variable
+    __slots__ = ('name', 'value')
+
+class IRPrint(Node):
+    __slots__ = ('value',)
+
+class IRReturn(Node):
+    __slots__ = ('value',)
+
+class IRIf(Node):
+    __slots__ = ('condition', 'body', 'orelse')
+
+class IRWhile(Node):
+    __slots__ = ('condition', 'body')
+
+class IREval(Node):        # expression evaluated for its side effects
+    __slots__ = ('value',)
+
+class IRConst(Node):
+    __slots__ = ('value',)
+
+class IRLoad(Node):
+    __slots__ = ('name',)
+
+class IRBinary(Node):
+    __slots__ = ('op', 'left', 'right')
+
+    def operands(self):
+        return (self.left, self.right)
+
+class IRUnary(Node):
+    __slots__ = ('op', 'operand')
+
+    def operands(self):
+        return (self.operand,)
+
+class IRCall(Node):
+    __slots__ = ('name', 'args')
+
+    def operands(self):
+        return self.args
+
+class IRGroup(Node):
+    __slots__ = ('expr',)
+
+    def operands(self):
+        return (self.expr,)
+
+# Devanagari to ASCII transliteration used for C identifiers
+TRANSLITERATION = {
+    'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ii', 'उ': 'u', 'ऊ': 'uu',
+    'ऋ': 'ri', 'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ं': 'm', 'ः': 'h',
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ng',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'ny',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v',
+    'श': 'sh', 'ष': 'sh', 'स': 's', 'ह': 'h',
+    'क्ष': 'ksh', 'त्र': 'tr', 'ज्ञ': 'gy',
+    'ा': 'aa', 'ि': 'i', 'ी': 'ii', 'ु': 'u', 'ू': 'uu',
+    'ृ': 'ri', 'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au',
+    '्': ''
+}
+
+# Conjuncts with a spelling of their own, replaced before their letters
+_CONJUNCTS = tuple((seq, ascii) for seq, ascii in TRANSLITERATION.items() if len(seq) > 1)
+_LETTERS = str.maketrans({char: ascii for char, ascii in TRANSLITERATION.items() if len(char) == 1})
+_NOT_IDENTIFIER = re.compile(r'[^a-zA-Z0-9_]')
+
+# Words a transliterated name must not take: C++17 keywords and alternative
+# tokens (and those C++20 adds), C99/C11 keywords, and the names the
+# generated code itself defines or uses.
+RESERVED_NAMES = frozenset("""
+    alignas alignof asm auto bool break case catch char char16_t char32_t class const
+    const_cast constexpr continue decltype default delete do double dynamic_cast else enum
+    explicit export extern false float for friend goto if inline int long mutable namespace
+    new noexcept nullptr operator private protected public register reinterpret_cast return
+    short signed sizeof static static_assert static_cast struct switch template this
+    thread_local throw true try typedef typeid typename union unsigned using virtual void
+    volatile wchar_t while
+    and and_eq bitand bitor compl not not_eq or or_eq xor xor_eq
+    char8_t concept consteval constinit co_await co_return co_yield requires
+    restrict _Alignas _Alignof _Atomic _Bool _Complex _Generic _Imaginary _Noreturn
+    _Static_assert _Thread_local
+    main std cout cerr endl printf array list pair unordered_map size_t MemoCache memo key result
+    string to_string jmp_buf setjmp longjmp sanskrit_output sanskrit_trap sanskrit_failed_in
+    sanskrit_failure sanskrit_print sanskrit_fail sanskrit_div sanskrit_mod sanskrit_output_data
+    sanskrit_output_size sanskrit_output_clear sanskrit_error_function sanskrit_error sanskrit_functions
+    sanskrit_program
+""".split())
+
+@lru_cache(maxsize=4096)
+def transliterate(word):
+    """
+    Returns the ASCII spelling of a Devanagari identifier. Distinct words
+    may share a spelling (ट and त are both 't'); Lowering resolves that.
+    """
+    for conjunct, ascii in _CONJUNCTS:
+        word = word.replace(conjunct, ascii)
+    ascii_name = _NOT_IDENTIFIER.sub('', word.translate(_LETTERS))
+    if ascii_name and ascii_name[0].isdigit():
+        return '_' + ascii_name
+    return ascii_name or "unnamed"
+
+class Lowering:
+    """
+    Lowers the AST to IR, resolving names in source order. `assigned`
+    fixes the C spelling of names ahead of time, for callers that lower
+    one function of a larger program.
+    """
+    def __init__(self, assigned=None):
+        self.translit_map = {}           # variable or parameter name -> C spelling, program-wide
+        self.function_map = {}           # function name -> C spelling
+        self.symbols = SymbolTable()
+        self.function = None             # spelling of the function being lowered
+        self.owners = {}                 # C spelling -> (kind, Sanskrit name) using it
+        self.next_suffix = {}            # transliteration -> next suffix to try for it
+        self.assigned = assigned or {}
+
+    def _bind(self, name_skt, name_ascii=None):
+        """Returns the C spelling of a variable or parameter, chosen the first time it is bound."""
+        spelling = self.translit_map.get(name_skt)
+        if spelling is None:
+            spelling = self.assigned.get(name_skt)
+            if spelling is None:
+                spelling = self._claim(('variable', name_skt), name_ascii)
+            self.translit_map[name_skt] = spelling
+        return spelling
+
+    def _bind_function(self, name_skt, name_ascii=None):
+        """
+        Returns the C spelling of a function. Functions and variables are
+        spelled apart, so a local that shares a function's name can still
+        call it.
+        """
+        spelling = self.function_map.get(name_skt)
+        if spelling is None:
+            spelling = self._claim(('function', name_skt), name_ascii)
+            self.function_map[name_skt] = spelling
+        return spelling
+
+    def _claim(self, owner, name_ascii=None):
+        """
+        Picks a spelling no other name has: the transliteration, or on a
+        collision the first free one of <spelling>_2, <spelling>_3, ...
+        `owner` is the (kind, Sanskrit name) it is for. An explicit
+        `name_ascii` (main) is always granted.
+        """
+        if name_ascii is None:
+            base = transliterate(owner[1])
+            name_ascii = base
+            if name_ascii in RESERVED_NAMES or self.owners.get(name_ascii, owner) != owner:
+                # A base's suffixes are handed out in order, so probing
+                # resumes after the last one instead of at _2
+                suffix = self.next_suffix.get(base, 2)
+                name_ascii = f"{base}_{suffix}"
+                while name_ascii in RESERVED_NAMES or self.owners.get(name_ascii, owner) != owner:
+                    suffix += 1
+                    name_ascii = f"{base}_{suffix}"
+                self.next_suffix[base] = suffix + 1
+        self.owners[name_ascii] = owner
+        return name_ascii
+
+    def lower_program(self, program):
+        return IRProgram([self.lower_function(func) for func in program.functions])
+
+    def lower_function(self, func):
+        name = self._bind_function(func.name, 'main' if func.name == 'मुख्य' else None)
+        first = len(self.symbols.symbols)
+        self.symbols.declare_function(func.name, name)
+        self.function = name
+        self.symbols.push()
+        params = []
+        for param in func.params:
+            params.append(self._bind(param))
+            self.symbols.declare(param, params[-1], 'parameter', name)
+        body = self.lower_block(func.body)
+        self.symbols.pop()
+        ir_function = IRFunction(name, params, body, self.symbols.symbols[first:])
+        for declared in ir_function.symbols[:len(params) + 1]:
+            declared.site = ir_function
+        return ir_function
+
+    def lower_block(self, statements):
+        return [self.lower_statement(stmt) for stmt in statements]
+
+    def lower_scope(self, statements):
+        """Lowers a nested block, whose declarations end with it."""
+        self.symbols.push()
+        body = self.lower_block(statements)
+        self.symbols.pop()
+        return body
+
+    def lower_statement(self, stmt):
+        kind = type(stmt)
+        if kind is Assign:
+            name = self._bind(stmt.name)
+            value = self.lower_expression(stmt.value)
+            if self.symbols.lookup(stmt.name) is not None:
+                return IRStore(name, value)
+            declare = IRDeclare(name, value)
+            self.symbols.declare(stmt.name, name, 'variable', self.function, declare)
+            return declare
+        if kind is Print:
+            return IRPrint(self.lower_expression(stmt.value))
+        if kind is Return:
+            return IRReturn(self.lower_expression(stmt.value))
+        if kind is If:
+            condition = self.lower_expression(stmt.condition)
+            body = self.lower_scope(stmt.body)
+            orelse = None
+            if stmt.orelse is not None:
+                orelse = self.lower_scope(stmt.orelse)
+            return IRIf(condition, body, orelse)
+        if kind is While:
+            condition = self.lower_expression(stmt.condition)
+            return IRWhile(condition, self.lower_scope(stmt.body))
+        return IREval(self.lower_expression(stmt.value))
+
+    def lower_expression(self, expr):
+        return walk_postorder(expr, self.lower_node)
+
+    def lower_node(self, expr, operands):
+        """Lowers one expression node whose operands are already lowered."""
+        kind = type(expr)
+        if kind is Number:
+            return IRConst(expr.value)
+        if kind is Name:
+            symbol = self.symbols.lookup(expr.name)
+            if symbol is not None:
+                symbol.uses += 1
+                return IRLoad(symbol.spelling)
+            # Not declared here: keep any spelling the name was given elsewhere
+            return IRLoad(self.translit_map.get(expr.name, expr.name))
+        if kind is BinaryOp:
+            return IRBinary(expr.op, operands[0], operands[1])
+        if kind is UnaryOp:
+            return IRUnary(expr.op, operands[0])
+        if kind is Call:
+            symbol = self.symbols.functions.get(expr.name)
+            if symbol is not None:
+                symbol.uses += 1
+                return IRCall(symbol.spelling, list(operands))
+            return IRCall(self.function_map.get(expr.name, expr.name), list(operands))
+        return IRGroup(operands[0])
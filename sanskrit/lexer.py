@@ -0,0 +1,142 @@
+import re
+import sys
+
+# =====================================================================
+# Lexer (Tokenizer)
+# =====================================================================
+# This part breaks the code into a sequence of tokens.
+
+class Token:
+    """Represents a token with a type and a value."""
+    __slots__ = ('type', 'value', 'line', 'col')
+
+    def __init__(self, type, value, line=0, col=0):
+        self.type = type
+        self.value = value
+        self.line = line
+        self.col = col
+
+    def __repr__(self):
+        return f"Token({TOKEN_NAMES[self.type]}, {repr(self.value)})"
+
+# Token types (small ints; TOKEN_NAMES maps them back for messages)
+TT_KEYWORD    = 0
+TT_IDENTIFIER = 1
+TT_NUMBER     = 2
+TT_LPAREN     = 3   # (
+TT_RPAREN     = 4   # )
+TT_LBRACE     = 5   # {
+TT_RBRACE     = 6   # }
+TT_EQ         = 7   # =
+TT_COMMA      = 8   # ,
+TT_SEMICOLON  = 9   # ;
+TT_OPERATOR   = 10
+TT_EOF        = 11  # End of File
+
+TOKEN_NAMES = (
+    'KEYWORD',
+    'IDENTIFIER',
+    'NUMBER',
+    'LPAREN',
+    'RPAREN',
+    'LBRACE',
+    'RBRACE',
+    'EQ',
+    'COMMA',
+    'SEMICOLON',
+    'OPERATOR',
+    'EOF',
+)
+
+# Mapping of keywords to their Sanskrit representation
+KEYWORDS = {
+    'स्थापय': 'STAPAYA',     # Assign/Declare
+    'लेखय': 'LEKHAYA',       # Print
+    'यदि': 'YADI',           # If
+    'अन्यथा': 'ANYATHA',     # Else
+    'दौर': 'DAUR',           # While
+    'कार्यम्': 'KARYAM',     # Function
+    'प्रतिफलम्': 'PRATIPHALAM', # Return
+}
+
+# Master scanner pattern. Each match swallows any leading whitespace and
+# comments, then captures exactly one token in the named group for its class.
+# Identifier characters mirror the original hand-written loop: anything
+# str.isalnum() accepts, plus the whole Devanagari block so that matras and
+# the virama (which are not alphanumeric) stay inside the word.
+TOKEN_PATTERN = re.compile(r"""
+    (?:\s+|\#[^\n]*)*
+    (?:
+          (?P<NUMBER>\d+)
+        | (?P<NAME>(?:[^\W_]|[\u0900-\u097F])+)
+        | (?P<PUNCT>[(){},;])
+        | (?P<OPERATOR>==|[+\-*/%<>]=?)
+        | (?P<EQ>=)
+        | (?P<END>\Z)
+        | (?P<INVALID>.)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+PUNCTUATION = {
+    '(': TT_LPAREN,
+    ')': TT_RPAREN,
+    '{': TT_LBRACE,
+    '}': TT_RBRACE,
+    ',': TT_COMMA,
+    ';': TT_SEMICOLON,
+}
+
+class Lexer:
+    """
+    The lexer, responsible for breaking the source code
+    into a stream of tokens.
+    """
+    def __init__(self, text):
+        # Either the whole source as a string, or any iterable of lines
+        # (such as an open file) so large programs never sit in memory at once.
+        self.text = text
+        self._stream = self.tokenize()
+
+    def _chunks(self):
+        """Returns the pieces of source to scan; no token ever spans a line break."""
+        if isinstance(self.text, str):
+            return (self.text,)
+        return self.text
+
+    def _make_token(self, kind, lexeme):
+        """Builds the token for a lexeme the scanner has not seen before."""
+        if kind == 'NAME':
+            # Names repeat constantly, so intern them: equal names share one
+            # string object and compare by identity.
+            lexeme = sys.intern(lexeme)
+            return Token(TT_KEYWORD if lexeme in KEYWORDS else TT_IDENTIFIER, lexeme)
+        if kind == 'NUMBER':
+            return Token(TT_NUMBER, int(lexeme))
+        if kind == 'PUNCT':
+            return Token(PUNCTUATION[lexeme], lexeme)
+        if kind == 'OPERATOR':
+            return Token(TT_OPERATOR, lexeme)
+        if kind == 'EQ':
+            return Token(TT_EQ, lexeme)
+        raise Exception(f"Invalid character: '{lexeme}'")
+
+    def tokenize(self):
+        """Yields every token in a single pass over the source, ending with EOF."""
+        # A lexeme always produces the same token, so each distinct spelling is
+        # built once and the (never mutated) Token object is shared afterwards.
+        seen = {}
+        for chunk in self._chunks():
+            for match in TOKEN_PATTERN.finditer(chunk):
+                lexeme = match.group(match.lastindex)
+                token = seen.get(lexeme)
+                if token is None:
+                    kind = match.lastgroup
+                    if kind == 'END':
+                        break
+                    token = seen[lexeme] = self._make_token(kind, lexeme)
+                yield token
+        yield Token(TT_EOF, None)
+
+    def get_next_token(self):
+        """Lexical analyzer (also known as scanner or tokenizer)"""
+        return next(self._stream, None) or Token(TT_EOF, None)
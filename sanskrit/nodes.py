@@ -0,0 +1,115 @@
+# =====================================================================
+# Abstract Syntax Tree
+# =====================================================================
+# The parser produces these nodes. Names are kept exactly as written in
+# the source; nothing here knows about C++.
+
+class Node:
+    """Base class for tree nodes; subclasses list their fields in __slots__."""
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    def __repr__(self):
+        fields = ", ".join(repr(getattr(self, field)) for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def operands(self):
+        """Returns the subexpressions of an expression node, in evaluation order."""
+        return ()
+
+class Program(Node):
+    __slots__ = ('functions',)
+
+class FunctionDef(Node):
+    __slots__ = ('name', 'params', 'body')
+
+class Assign(Node):        # स्थापय name = value;
+    __slots__ = ('name', 'value')
+
+class Print(Node):         # लेखय(value);
+    __slots__ = ('value',)
+
+class Return(Node):        # प्रतिफलम् value;
+    __slots__ = ('value',)
+
+class If(Node):            # यदि (condition) { body } अन्यथा { orelse }
+    __slots__ = ('condition', 'body', 'orelse')
+
+class While(Node):         # दौर (condition) { body }
+    __slots__ = ('condition', 'body')
+
+class ExprStatement(Node): # value;
+    __slots__ = ('value',)
+
+class Number(Node):
+    __slots__ = ('value',)
+
+class Name(Node):
+    __slots__ = ('name',)
+
+class BinaryOp(Node):
+    __slots__ = ('op', 'left', 'right')
+
+    def operands(self):
+        return (self.left, self.right)
+
+class UnaryOp(Node):
+    __slots__ = ('op', 'operand')
+
+    def operands(self):
+        return (self.operand,)
+
+class Call(Node):
+    __slots__ = ('name', 'args')
+
+    def operands(self):
+        return self.args
+
+class Grouping(Node):      # ( expr ), kept so the output keeps the source's parentheses
+    __slots__ = ('expr',)
+
+    def operands(self):
+        return (self.expr,)
+
+# Binding power of each binary operator (C rules; higher binds tighter).
+# All of them associate to the left.
+BINARY_PRECEDENCE = {
+    '==': 1,
+    '<': 2, '>': 2, '<=': 2, '>=': 2,
+    '+': 3, '-': 3,
+    '*': 4, '/': 4, '%': 4,
+}
+UNARY_OPERATORS = ('-', '+')
+
+def walk_postorder(root, visit):
+    """
+    Calls visit(node, results) for every node of an expression tree,
+    operands before the node that uses them, where `results` holds what
+    visit returned for the node's operands. Returns the result for the root.
+    An explicit stack replaces recursion, so expressions of any depth work.
+    """
+    operands = root.operands()
+    if not operands:
+        return visit(root, ())      # most expressions are a single name or number
+    # Preorder with the operands taken right to left; reversed, that is
+    # postorder with the operands left to right.
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        operands = node.operands()
+        order.append((node, operands))
+        stack.extend(operands)
+    results = []
+    for node, operands in reversed(order):
+        if operands:
+            count = len(operands)
+            values = results[-count:]
+            del results[-count:]
+            results.append(visit(node, values))
+        else:
+            results.append(visit(node, ()))
+    return results[0]
@@ -0,0 +1,572 @@
+from .ir import IRBinary, IRCall, IRConst, IRDeclare, IREval, IRGroup, IRIf, IRLoad, IRPrint, \
+    IRReturn, IRStore, IRUnary, IRWhile
+from .nodes import walk_postorder
+
+# =====================================================================
+# Optimization Passes
+# =====================================================================
+# IR-to-IR rewrites that run between lowering and code generation.
+
+# Range of the C `int` every value is emitted as. INT_MIN itself is left
+# out because C has no literal for it.
+INT_MIN = -2**31
+INT_MAX = 2**31 - 1
+
+# Default number of entries each memoized function keeps
+MEMO_SIZE = 100_000
+
+def _in_int_range(value):
+    return INT_MIN < value <= INT_MAX
+
+def fold_binary(op, a, b):
+    """Evaluates `a op b` with C int semantics, or returns None if that is not safe."""
+    if not (_in_int_range(a) and _in_int_range(b)):
+        return None
+    if op in ('/', '%'):
+        if b == 0:
+            return None
+        # C division truncates toward zero and the remainder takes the sign of a
+        quotient = abs(a) // abs(b)
+        if (a < 0) != (b < 0):
+            quotient = -quotient
+        value = quotient if op == '/' else a - b * quotient
+    elif op == '+':
+        value = a + b
+    elif op == '-':
+        value = a - b
+    elif op == '*':
+        value = a * b
+    elif op == '<':
+        value = int(a < b)
+    elif op == '>':
+        value = int(a > b)
+    elif op == '<=':
+        value = int(a <= b)
+    elif op == '>=':
+        value = int(a >= b)
+    elif op == '==':
+        value = int(a == b)
+    else:
+        return None
+    # Signed overflow is undefined in C, so leave it for the C compiler
+    return value if _in_int_range(value) else None
+
+def fold_unary(op, a):
+    """Evaluates a prefix sign with C int semantics, or returns None if that is not safe."""
+    value = -a if op == '-' else a
+    return value if _in_int_range(a) and _in_int_range(value) else None
+
+def assigned_names(statements, declared_only=False):
+    """Returns the names stored to (or only declared) anywhere in a block."""
+    names = set()
+    for stmt in statements:
+        kind = type(stmt)
+        if kind is IRDeclare or (kind is IRStore and not declared_only):
+            names.add(stmt.name)
+        elif kind is IRIf:
+            names |= assigned_names(stmt.body, declared_only)
+            if stmt.orelse is not None:
+                names |= assigned_names(stmt.orelse, declared_only)
+        elif kind is IRWhile:
+            names |= assigned_names(stmt.body, declared_only)
+    return names
+
+class ConstantFolder:
+    """
+    Folds constant subexpressions and propagates variables whose value is
+    known at compile time, within each function.
+    """
+    def __init__(self):
+        self.folded = 0       # operator expressions replaced by their value
+        self.propagated = 0   # variable reads replaced by a known constant
+
+    def run(self, program):
+        for func in program.functions:
+            # Parameters are unknown on entry; function calls cannot touch
+            # the caller's locals, so they never invalidate what is known.
+            self.block(func.body, {})
+        return program
+
+    def block(self, statements, known):
+        for stmt in statements:
+            self.statement(stmt, known)
+
+    def statement(self, stmt, known):
+        kind = type(stmt)
+        if kind is IRDeclare or kind is IRStore:
+            stmt.value = self.expression(stmt.value, known)
+            if type(stmt.value) is IRConst and _in_int_range(stmt.value.value):
+                known[stmt.name] = stmt.value.value
+            else:
+                known.pop(stmt.name, None)
+        elif kind is IRIf:
+            stmt.condition = self.expression(stmt.condition, known)
+            body_known = dict(known)
+            self.block(stmt.body, body_known)
+            orelse_known = dict(known)
+            if stmt.orelse is not None:
+                self.block(stmt.orelse, orelse_known)
+            # After the branches meet, a value is known only if both paths agree.
+            # Names declared inside a branch are local to it.
+            local = assigned_names(stmt.body, True)
+            if stmt.orelse is not None:
+                local |= assigned_names(stmt.orelse, True)
+            known.clear()
+            for name, value in body_known.items():
+                if name not in local and orelse_known.get(name) == value:
+                    known[name] = value
+        elif kind is IRWhile:
+            # Anything the loop assigns may differ on every iteration
+            for name in assigned_names(stmt.body):
+                known.pop(name, None)
+            stmt.condition = self.expression(stmt.condition, known)
+            self.block(stmt.body, dict(known))
+        else:
+            stmt.value = self.expression(stmt.value, known)
+
+    def expression(self, expr, known):
+        """Returns `expr` with constant parts folded."""
+        return walk_postorder(expr, lambda node, operands: self.fold_node(node, operands, known))
+
+    def fold_node(self, expr, operands, known):
+        """Folds one expression node whose operands are already folded."""
+        kind = type(expr)
+        if kind is IRConst:
+            return expr
+        if kind is IRLoad:
+            value = known.get(expr.name)
+            if value is None:
+                return expr
+            self.propagated += 1
+            return IRConst(value)
+        if kind is IRBinary:
+            expr.left, expr.right = operands
+            if type(expr.left) is IRConst and type(expr.right) is IRConst:
+                value = fold_binary(expr.op, expr.left.value, expr.right.value)
+                if value is not None:
+                    self.folded += 1
+                    return IRConst(value)
+            return expr
+        if kind is IRUnary:
+            expr.operand = operands[0]
+            if type(expr.operand) is IRConst:
+                value = fold_unary(expr.op, expr.operand.value)
+                if value is not None:
+                    self.folded += 1
+                    return IRConst(value)
+            return expr
+        if kind is IRCall:
+            expr.args = list(operands)
+            return expr
+        expr.expr = operands[0]
+        # Parentheses around a single value are no longer needed
+        if type(expr.expr) is IRConst:
+            return expr.expr
+        return expr
+
+def _statement_count(statements):
+    """Counts the statements in an IR block, including those in nested blocks."""
+    total = 0
+    for stmt in statements:
+        total += 1
+        kind = type(stmt)
+        if kind is IRIf:
+            total += _statement_count(stmt.body)
+            if stmt.orelse is not None:
+                total += _statement_count(stmt.orelse)
+        elif kind is IRWhile:
+            total += _statement_count(stmt.body)
+    return total
+
+def _loads(expr):
+    """Returns the names an expression reads, once per read, and whether it calls anything."""
+    names = []
+    calls = False
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+        if kind is IRLoad:
+            names.append(node.name)
+        elif kind is IRCall:
+            calls = True
+        stack.extend(node.operands())
+    return names, calls
+
+def _terminates(stmt):
+    """
+    Returns what stops control continuing past `stmt`, as the report
+    words it, or None if it can continue (blocks are already cut at their
+    first such statement).
+    """
+    kind = type(stmt)
+    if kind is IRReturn:
+        return "प्रतिफलम्"
+    if kind is IRIf:
+        if stmt.orelse is None or not stmt.body or not stmt.orelse:
+            return None
+        body, orelse = _terminates(stmt.body[-1]), _terminates(stmt.orelse[-1])
+        if body is None or orelse is None:
+            return None
+        return body if body == orelse else "a यदि whose branches all return or loop forever"
+    # The language has no break, so only a प्रतिफलम् leaves an endless दौर
+    if kind is IRWhile and type(stmt.condition) is IRConst and stmt.condition.value != 0:
+        return "an endless दौर (its condition is always true)"
+    return None
+
+class DeadCodeEliminator:
+    """
+    Removes statements that can never run (after a प्रतिफलम् or an endless
+    दौर, in the untaken branch of a यदि with a constant condition, in a दौर
+    that never starts) and assignments to variables whose value is never
+    read. An assignment whose value calls a function keeps the call. Each
+    removal is recorded in `dropped` as (function, description), in source
+    names.
+    """
+    def __init__(self):
+        self.removed = 0      # statements removed, counting those nested inside them
+        self.dropped = []
+        self.names = {}       # C spelling -> source name, for the current function
+        self.function = None
+
+    def run(self, program):
+        for func in program.functions:
+            self.names = {symbol.spelling: symbol.name for symbol in func.symbols}
+            self.function = self.names.get(func.name, func.name)
+            func.body = self.block(func.body)
+            self.dead_stores(func)
+        return program
+
+    def report(self, description, statements):
+        self.removed += statements
+        self.dropped.append((self.function, description))
+
+    def block(self, statements):
+        kept = []
+        for index, stmt in enumerate(statements):
+            replacement = self.statement(stmt)
+            for position, new in enumerate(replacement):
+                cause = _terminates(new)
+                if cause is not None:
+                    kept += replacement[:position + 1]
+                    unreachable = replacement[position + 1:] + statements[index + 1:]
+                    if unreachable:
+                        count = _statement_count(unreachable)
+                        self.report(f"{count} unreachable statement(s) after {cause}", count)
+                    return kept
+            kept += replacement
+        return kept
+
+    def statement(self, stmt):
+        """Returns the statements that replace `stmt`."""
+        kind = type(stmt)
+        if kind is IRIf:
+            stmt.body = self.block(stmt.body)
+            if stmt.orelse is not None:
+                stmt.orelse = self.block(stmt.orelse)
+            if type(stmt.condition) is not IRConst:
+                return [stmt]
+            if stmt.condition.value != 0:
+                taken = stmt.body
+                if stmt.orelse is not None:
+                    self.report("अन्यथा branch of a यदि that is always true",
+                                _statement_count(stmt.orelse))
+            else:
+                taken = stmt.orelse or []
+                self.report("body of a यदि that is never true", _statement_count(stmt.body))
+            if any(type(new) is IRDeclare for new in taken):
+                # Its declarations must stay in a scope of their own
+                return [IRIf(IRConst(1), taken, None)]
+            return taken
+        if kind is IRWhile:
+            if type(stmt.condition) is IRConst and stmt.condition.value == 0:
+                self.report("दौर that never runs", 1 + _statement_count(stmt.body))
+                return []
+            stmt.body = self.block(stmt.body)
+        return [stmt]
+
+    def dead_stores(self, func):
+        """
+        Removes the assignments to variables that are never read. A read
+        only by the variable's own assignments (x = x + 1) does not count,
+        and removing an assignment may leave the names it read unused too.
+        """
+        reads = {}
+        stores = {}
+        self.collect(func.body, reads, stores)
+        dead = set()
+        unused = [name for name in stores if not reads.get(name)]
+        while unused:
+            name = unused.pop()
+            for stmt in stores[name]:
+                dead.add(id(stmt))
+                loaded, calls = _loads(stmt.value)
+                if calls:
+                    continue    # the value is kept for its calls, reads and all
+                for other in loaded:
+                    if other != name:
+                        reads[other] -= 1
+                        if reads[other] == 0 and other in stores:
+                            unused.append(other)
+            self.dropped.append((self.function, f"{len(stores[name])} assignment(s) to "
+                                                f"'{self.names.get(name, name)}', which is never read"))
+        if dead:
+            func.body = self.without(func.body, dead)
+
+    def collect(self, statements, reads, stores):
+        """Counts the reads of every name and gathers the assignments to each."""
+        for stmt in statements:
+            kind = type(stmt)
+            if kind is IRIf or kind is IRWhile:
+                self.count_reads(_loads(stmt.condition)[0], reads)
+                self.collect(stmt.body, reads, stores)
+                if kind is IRIf and stmt.orelse is not None:
+                    self.collect(stmt.orelse, reads, stores)
+            elif kind is IRDeclare or kind is IRStore:
+                stores.setdefault(stmt.name, []).append(stmt)
+                loaded, calls = _loads(stmt.value)
+                # A value with calls outlives its assignment, reads and all
+                self.count_reads(loaded, reads, None if calls else stmt.name)
+            else:
+                self.count_reads(_loads(stmt.value)[0], reads)
+
+    def count_reads(self, loaded, reads, skip=None):
+        for name in loaded:
+            if name != skip:
+                reads[name] = reads.get(name, 0) + 1
+
+    def without(self, statements, dead):
+        """Returns a block without the dead assignments, keeping any calls they make."""
+        kept = []
+        for stmt in statements:
+            kind = type(stmt)
+            if id(stmt) in dead:
+                if _loads(stmt.value)[1]:
+                    kept.append(IREval(stmt.value))
+                else:
+                    self.removed += 1
+                continue
+            if kind is IRIf:
+                stmt.body = self.without(stmt.body, dead)
+                if stmt.orelse is not None:
+                    stmt.orelse = self.without(stmt.orelse, dead)
+            elif kind is IRWhile:
+                stmt.body = self.without(stmt.body, dead)
+            kept.append(stmt)
+        return kept
+
+# Prefix of the temporaries that hold hoisted values. A transliterated
+# name only has an underscore before digits, so these cannot clash.
+HOIST_PREFIX = "licm_t"
+
+def _assignment_counts(statements, counts):
+    """Adds the number of assignments to each name anywhere in a block to `counts`."""
+    for stmt in statements:
+        kind = type(stmt)
+        if kind is IRDeclare or kind is IRStore:
+            counts[stmt.name] = counts.get(stmt.name, 0) + 1
+        elif kind is IRIf:
+            _assignment_counts(stmt.body, counts)
+            if stmt.orelse is not None:
+                _assignment_counts(stmt.orelse, counts)
+        elif kind is IRWhile:
+            _assignment_counts(stmt.body, counts)
+    return counts
+
+def _worth_hoisting(expr):
+    """True unless the expression is already a single value."""
+    while type(expr) is IRGroup:
+        expr = expr.expr
+    return type(expr) is not IRConst and type(expr) is not IRLoad
+
+def _set_operands(node, operands):
+    kind = type(node)
+    if kind is IRBinary:
+        node.left, node.right = operands
+    elif kind is IRUnary:
+        node.operand = operands[0]
+    elif kind is IRCall:
+        node.args = list(operands)
+    else:
+        node.expr = operands[0]
+
+class LoopInvariantMotion:
+    """
+    Moves computations that give the same value on every iteration of a
+    दौर out of it, into temporaries declared just before the loop. An
+    expression is invariant when it reads only variables the loop never
+    assigns, calls nothing and cannot trap, so evaluating it early (or
+    when the loop never runs) changes nothing; that holds inside यदि
+    branches too. A variable declared once at the top of the loop body
+    from an invariant value is itself invariant. Inner loops go first, so
+    a value can move out of several loops.
+    """
+    def __init__(self):
+        self.hoisted = 0        # expressions moved out of a loop
+        self.temporaries = 0    # temporaries made in the current function
+
+    def run(self, program):
+        for func in program.functions:
+            self.temporaries = 0
+            func.body = self.block(func.body)
+        return program
+
+    def block(self, statements):
+        result = []
+        for stmt in statements:
+            kind = type(stmt)
+            if kind is IRIf:
+                stmt.body = self.block(stmt.body)
+                if stmt.orelse is not None:
+                    stmt.orelse = self.block(stmt.orelse)
+            elif kind is IRWhile:
+                stmt.body = self.block(stmt.body)
+                result += self.loop(stmt)
+            result.append(stmt)
+        return result
+
+    def loop(self, loop):
+        """Rewrites a loop in place; returns the declarations to put before it."""
+        counts = _assignment_counts(loop.body, {})
+        aliases = {}    # variable declared in the body from an invariant value -> that value
+        hoisted = []
+        loop.condition = self.expression(loop.condition, counts, aliases, hoisted)
+        for stmt in loop.body:
+            if type(stmt) is IRDeclare and counts[stmt.name] == 1:
+                value, invariant = self.rewrite(stmt.value, counts, aliases, hoisted)
+                if invariant:
+                    if _worth_hoisting(value):
+                        value = self.hoist(value, hoisted)
+                    if type(value) is IRConst or type(value) is IRLoad:
+                        aliases[stmt.name] = value
+                stmt.value = value
+            else:
+                self.statement(stmt, counts, aliases, hoisted)
+        return hoisted
+
+    def statement(self, stmt, counts, aliases, hoisted):
+        kind = type(stmt)
+        if kind is IRIf:
+            stmt.condition = self.expression(stmt.condition, counts, aliases, hoisted)
+            for inner in stmt.body:
+                self.statement(inner, counts, aliases, hoisted)
+            for inner in stmt.orelse or ():
+                self.statement(inner, counts, aliases, hoisted)
+        elif kind is not IRWhile:   # inner loops kept what varies in them, which varies here too
+            stmt.value = self.expression(stmt.value, counts, aliases, hoisted)
+
+    def expression(self, expr, counts, aliases, hoisted):
+        """Returns `expr` with its invariant parts, or all of it, hoisted."""
+        expr, invariant = self.rewrite(expr, counts, aliases, hoisted)
+        if invariant and _worth_hoisting(expr):
+            return self.hoist(expr, hoisted)
+        return expr
+
+    def rewrite(self, expr, counts, aliases, hoisted):
+        """
+        Returns (expr, invariant). In an expression that varies, each
+        largest invariant part is replaced by a temporary.
+        """
+        def visit(node, results):
+            kind = type(node)
+            if kind is IRConst:
+                return node, True
+            if kind is IRLoad:
+                alias = aliases.get(node.name)
+                if alias is not None:
+                    return (IRLoad(alias.name) if type(alias) is IRLoad else IRConst(alias.value)), True
+                return node, node.name not in counts
+            invariant = kind is not IRCall and all(flag for _, flag in results)
+            if invariant and kind is IRBinary and node.op in ('/', '%'):
+                # Only a constant divisor rules out a trap (or overflow, for -1)
+                divisor = results[1][0]
+                invariant = type(divisor) is IRConst and divisor.value not in (0, -1)
+            if invariant:
+                _set_operands(node, [value for value, _ in results])
+            else:
+                _set_operands(node, [self.hoist(value, hoisted) if flag and _worth_hoisting(value)
+                                     else value for value, flag in results])
+            return node, invariant
+        return walk_postorder(expr, visit)
+
+    def hoist(self, expr, hoisted):
+        self.temporaries += 1
+        self.hoisted += 1
+        name = f"{HOIST_PREFIX}{self.temporaries}"
+        hoisted.append(IRDeclare(name, expr))
+        return IRLoad(name)
+
+def _collect_effects(node, calls):
+    """Adds every function called under `node` to `calls`; returns True if it prints."""
+    kind = type(node)
+    if kind is list:
+        printed = False
+        for item in node:
+            printed = _collect_effects(item, calls) or printed
+        return printed
+    if kind is IRPrint:
+        _collect_effects(node.value, calls)
+        return True
+    if kind is IRIf:
+        printed = _collect_effects(node.condition, calls)
+        printed = _collect_effects(node.body, calls) or printed
+        if node.orelse is not None:
+            printed = _collect_effects(node.orelse, calls) or printed
+        return printed
+    if kind is IRWhile:
+        printed = _collect_effects(node.condition, calls)
+        return _collect_effects(node.body, calls) or printed
+    if kind is IRDeclare or kind is IRStore or kind is IRReturn or kind is IREval:
+        return _collect_effects(node.value, calls)
+    # An expression: it cannot print, but may call functions anywhere inside
+    stack = [node]
+    while stack:
+        expr = stack.pop()
+        if type(expr) is IRCall:
+            calls.add(expr.name)
+        stack.extend(expr.operands())
+    return False
+
+def pure_functions(program):
+    """
+    Returns the names of the functions whose result depends only on their
+    arguments: they never print and call only other pure functions. The
+    language has no global state, so that is all purity requires.
+    """
+    calls = {}
+    pure = set()
+    for func in program.functions:
+        calls[func.name] = set()
+        if not _collect_effects(func.body, calls[func.name]) and func.name != 'main':
+            pure.add(func.name)
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure):
+            if not calls[name] <= pure:
+                pure.discard(name)
+                changed = True
+    return pure
+
+# =====================================================================
+# Optimization Options
+# =====================================================================
+# The passes a caller can turn off, with the help text of each one's
+# --no-<name> switch. Compiler and IncrementalCompiler take them as
+# keyword arguments of the same names, and every front end passes one
+# {name: enabled} dict of them through.
+
+OPTIMIZATIONS = {
+    'fold': "disable constant folding and propagation",
+    'dce': "keep unreachable code and assignments that are never read",
+    'licm': "leave loop-invariant computations inside their loops",
+}
+
+def add_optimization_arguments(arg_parser):
+    """Adds a --no-<name> switch for each optimization to an argparse parser."""
+    for name, help_text in OPTIMIZATIONS.items():
+        arg_parser.add_argument(f"--no-{name}", action="store_true", help=help_text)
+
+def optimizations_from_args(args):
+    """Returns {name: enabled} for each optimization from parsed --no-<name> switches."""
+    return {name: not getattr(args, f"no_{name}") for name in OPTIMIZATIONS}
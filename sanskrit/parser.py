@@ -0,0 +1,247 @@
+from .lexer import Lexer, Token, TOKEN_NAMES, TT_COMMA, TT_EOF, TT_EQ, TT_IDENTIFIER, TT_KEYWORD, \
+    TT_LBRACE, TT_LPAREN, TT_NUMBER, TT_OPERATOR, TT_RBRACE, TT_RPAREN, TT_SEMICOLON
+from .nodes import Assign, BinaryOp, BINARY_PRECEDENCE, Call, ExprStatement, FunctionDef, Grouping, If, \
+    Name, Number, Print, Program, Return, UNARY_OPERATORS, UnaryOp, While
+
+# =====================================================================
+# Parser
+# =====================================================================
+# This part understands the grammar and builds the AST.
+
+# Each dialect is the set of language features one of the original
+# per-directory compilers accepted; 'print' (स्थापय and लेखय) is always on.
+DIALECTS = {
+    'print': frozenset({'print'}),
+    'loop': frozenset({'print', 'loop'}),
+    'condition': frozenset({'print', 'loop', 'condition'}),
+    'function': frozenset({'print', 'loop', 'condition', 'function'}),
+}
+
+# Feature a statement keyword belongs to
+KEYWORD_FEATURES = {
+    'दौर': 'loop',
+    'यदि': 'condition',
+    'अन्यथा': 'condition',
+    'कार्यम्': 'function',
+    'प्रतिफलम्': 'function',
+}
+
+class Parser:
+    def __init__(self, source_code, tokens=None, dialect='function'):
+        if dialect not in DIALECTS:
+            raise Exception(f"Unknown dialect: '{dialect}'")
+        self.dialect = dialect
+        self.features = DIALECTS[dialect]
+        self.lexer = Lexer(source_code)
+        # Tokens are pulled from the lexer as the parser advances; the grammar
+        # is LL(1), so current_token is the only lookahead ever buffered.
+        # An already scanned token iterator (ending with EOF) can be given instead.
+        self.tokens = tokens if tokens is not None else self.lexer.tokenize()
+        self.current_token = next(self.tokens)
+
+    def advance(self):
+        """Advance the token pointer."""
+        self.current_token = next(self.tokens, None) or Token(TT_EOF, None)
+
+    def eat(self, token_type, token_value=None):
+        """Consume the current token if it matches the expected type and value."""
+        if self.current_token.type == token_type and \
+           (token_value is None or self.current_token.value == token_value):
+            self.advance()
+        else:
+            expected = f"'{token_value}'" if token_value else TOKEN_NAMES[token_type]
+            raise Exception(f"Invalid syntax: Expected {expected}, got {self.current_token}")
+
+    def require(self, feature, token):
+        """Rejects a construct that the selected dialect does not include."""
+        if feature not in self.features:
+            raise Exception(f"{token} is not available in the '{self.dialect}' dialect")
+
+    def parse_expression(self):
+        """
+        Parses an expression by precedence climbing over an explicit stack.
+        Pending operators wait on `pending` until an operator that binds no
+        tighter arrives; parentheses and call argument lists open a frame on
+        the same stack. Every token is handled once and nothing recurses, so
+        long operator chains and deep nesting cost linear time.
+        """
+        operands = []
+        pending = []    # ('binary', op, precedence), ('unary', op), ('group',) or ('call', name, base)
+        while True:
+            # Expecting an operand, possibly after prefix signs or an opening '('
+            token = self.current_token
+            kind = token.type
+            if kind == TT_NUMBER:
+                self.advance()
+                operands.append(Number(token.value))
+            elif kind == TT_IDENTIFIER:
+                self.advance()
+                if self.current_token.type != TT_LPAREN:
+                    operands.append(Name(token.value))
+                else:
+                    self.require('function', token)
+                    self.advance()
+                    if self.current_token.type != TT_RPAREN:
+                        pending.append(('call', token.value, len(operands)))
+                        continue
+                    self.advance()
+                    operands.append(Call(token.value, []))
+            elif kind == TT_LPAREN:
+                self.advance()
+                pending.append(('group',))
+                continue
+            elif kind == TT_OPERATOR and token.value in UNARY_OPERATORS:
+                self.advance()
+                pending.append(('unary', token.value))
+                continue
+            else:
+                raise Exception(f"Invalid syntax: Unexpected {token} in expression")
+
+            # An operand is complete: apply prefix signs, then close any
+            # parentheses and argument lists that end here
+            while True:
+                while pending and pending[-1][0] == 'unary':
+                    operands[-1] = UnaryOp(pending.pop()[1], operands[-1])
+                token = self.current_token
+                kind = token.type
+                if kind == TT_OPERATOR and token.value in BINARY_PRECEDENCE:
+                    precedence = BINARY_PRECEDENCE[token.value]
+                    self.reduce(operands, pending, precedence)
+                    self.advance()
+                    pending.append(('binary', token.value, precedence))
+                    break
+                self.reduce(operands, pending, 0)
+                frame = pending[-1] if pending else None
+                if frame is None:
+                    return operands.pop()
+                if kind == TT_COMMA and frame[0] == 'call':
+                    self.advance()
+                    break
+                # Anything else must close the innermost '(' or argument list
+                self.eat(TT_RPAREN)
+                pending.pop()
+                if frame[0] == 'group':
+                    operands[-1] = Grouping(operands[-1])
+                else:
+                    args = operands[frame[2]:]
+                    del operands[frame[2]:]
+                    operands.append(Call(frame[1], args))
+
+    def reduce(self, operands, pending, precedence):
+        """Applies pending binary operators that bind at least as tightly as `precedence`."""
+        while pending and pending[-1][0] == 'binary' and pending[-1][2] >= precedence:
+            op = pending.pop()[1]
+            right = operands.pop()
+            operands[-1] = BinaryOp(op, operands[-1], right)
+
+    def parse_statement(self):
+        """Parses a single statement within a block."""
+        token = self.current_token
+        if token.type == TT_KEYWORD and token.value in KEYWORD_FEATURES:
+            self.require(KEYWORD_FEATURES[token.value], token)
+
+        if token.type == TT_KEYWORD and token.value == 'स्थापय':
+            self.eat(TT_KEYWORD, 'स्थापय')
+            var_name = self.current_token.value
+            self.eat(TT_IDENTIFIER)
+            self.eat(TT_EQ)
+            expr = self.parse_expression()
+            self.eat(TT_SEMICOLON)
+            return Assign(var_name, expr)
+
+        if token.type == TT_KEYWORD and token.value == 'लेखय':
+            self.eat(TT_KEYWORD, 'लेखय')
+            self.eat(TT_LPAREN)
+            expr = self.parse_expression()
+            self.eat(TT_RPAREN)
+            self.eat(TT_SEMICOLON)
+            return Print(expr)
+
+        if token.type == TT_KEYWORD and token.value == 'प्रतिफलम्':
+            self.eat(TT_KEYWORD, 'प्रतिफलम्')
+            expr = self.parse_expression()
+            self.eat(TT_SEMICOLON)
+            return Return(expr)
+
+        if token.type == TT_KEYWORD and token.value == 'यदि':
+            self.eat(TT_KEYWORD, 'यदि')
+            self.eat(TT_LPAREN)
+            condition = self.parse_expression()
+            self.eat(TT_RPAREN)
+            self.eat(TT_LBRACE)
+            body = self.parse_block()
+            self.eat(TT_RBRACE)
+
+            orelse = None
+            if self.current_token.type == TT_KEYWORD and self.current_token.value == 'अन्यथा':
+                self.eat(TT_KEYWORD, 'अन्यथा')
+                self.eat(TT_LBRACE)
+                orelse = self.parse_block()
+                self.eat(TT_RBRACE)
+            return If(condition, body, orelse)
+
+        if token.type == TT_KEYWORD and token.value == 'दौर':
+            self.eat(TT_KEYWORD, 'दौर')
+            self.eat(TT_LPAREN)
+            condition = self.parse_expression()
+            self.eat(TT_RPAREN)
+            self.eat(TT_LBRACE)
+            body = self.parse_block()
+            self.eat(TT_RBRACE)
+            return While(condition, body)
+
+        if token.type == TT_KEYWORD or 'function' not in self.features:
+            raise Exception(f"Unexpected statement: {token}")
+
+        # Handle function calls as statements
+        expr = self.parse_expression()
+        if self.current_token.type != TT_SEMICOLON:
+            raise Exception(f"Unexpected statement: {token}")
+        self.eat(TT_SEMICOLON)
+        return ExprStatement(expr)
+
+    def parse_block(self):
+        """Parses a block of statements inside {}."""
+        statements = []
+        while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
+            statements.append(self.parse_statement())
+        return statements
+
+    def parse_function_definition(self):
+        """Parses a function definition."""
+        self.eat(TT_KEYWORD, 'कार्यम्')
+        func_name = self.current_token.value
+        self.eat(TT_IDENTIFIER)
+        self.eat(TT_LPAREN)
+
+        params = []
+        if self.current_token.type == TT_IDENTIFIER:
+            params.append(self.current_token.value)
+            self.eat(TT_IDENTIFIER)
+            while self.current_token.type == TT_COMMA:
+                self.eat(TT_COMMA)
+                params.append(self.current_token.value)
+                self.eat(TT_IDENTIFIER)
+        self.eat(TT_RPAREN)
+
+        self.eat(TT_LBRACE)
+        body = self.parse_block()
+        self.eat(TT_RBRACE)
+        return FunctionDef(func_name, params, body)
+
+    def parse_program(self):
+        """Parses the whole source: a sequence of function definitions."""
+        if 'function' not in self.features:
+            # Without functions the whole source is the body of main
+            body = self.parse_block()
+            if self.current_token.type != TT_EOF:
+                raise Exception(f"Unexpected statement: {self.current_token}")
+            return Program([FunctionDef('मुख्य', [], body + [Return(Number(0))])])
+
+        functions = []
+        while self.current_token.type != TT_EOF:
+            if self.current_token.type == TT_KEYWORD and self.current_token.value == 'कार्यम्':
+                functions.append(self.parse_function_definition())
+            else:
+                raise Exception("Only function definitions are allowed at the top level.")
+        return Program(functions)
@@ -0,0 +1,164 @@
+import marshal
+import sys
+import threading
+from importlib.util import MAGIC_NUMBER
+
+from .compiler import Compiler
+
+# =====================================================================
+# Python Execution
+# =====================================================================
+# Runs programs translated by the Python backend inside this interpreter.
+# CPython compiles the generated module to a code object once; with a
+# BuildCache the code object is stored as a .pyc (magic number, a zeroed
+# header, then the marshalled code), so a later run of the same source and
+# flags skips both our compiler and CPython's, and loads in microseconds.
+
+# Deepest call chain allowed, as on the bytecode VM. Generated functions
+# recurse as Python calls, so they run on a thread with room for them.
+RECURSION_LIMIT = 1_000_000
+STACK_SIZE = 512 * 1024 * 1024
+
+_deep_calls = 0                 # calls running with the limit raised
+_saved_limit = None
+_deep_lock = threading.Lock()
+
+# Where लेखय writes, per thread, so concurrent calls into one loaded
+# module each get their own output
+_local = threading.local()
+
+def _write(text):
+    _local.write(text)
+
+def pyc_bytes(code):
+    """Returns a code object as the contents of a .pyc file."""
+    return MAGIC_NUMBER + bytes(12) + marshal.dumps(code)
+
+def load_pyc(data):
+    """Returns the code object in .pyc contents, or None if another Python wrote them."""
+    if data[:4] != MAGIC_NUMBER:
+        return None
+    return marshal.loads(data[16:])
+
+def compile_module(text, filename="program.py"):
+    """Compiles generated Python source to a code object."""
+    try:
+        return compile(text, filename, "exec")
+    except (SyntaxError, RecursionError, MemoryError) as e:
+        # CPython limits how deeply blocks and expressions nest
+        raise Exception(f"Python cannot compile the generated code: {e}")
+
+def build_code(source, flags, cache=None):
+    """
+    Returns the code object for a program compiled with the given Compiler
+    flags, and whether it came from the cache.
+    """
+    flags = dict(flags, target='python')
+    key = cache.key(source, dict(flags, unit="python", magic=MAGIC_NUMBER.hex())) if cache else None
+    cached = cache.lookup(key, "program.pyc") if cache else None
+    if cached is not None:
+        with open(cached, "rb") as f:
+            code = load_pyc(f.read())
+        if code is not None:
+            return code, True
+    code = compile_module(Compiler(source, **flags).compile())
+    if cache:
+        cache.store(key, "program.pyc", pyc_bytes(code))
+    return code, False
+
+def runtime_error(error):
+    """Translates an error raised by generated code into the VM's wording."""
+    name = None
+    trace = error.__traceback__
+    while trace is not None:
+        function = trace.tb_frame.f_code.co_name
+        if function.startswith("f_"):
+            name = function[2:]
+        trace = trace.tb_next
+    where = f" in '{name}'" if name else ""
+    if isinstance(error, ZeroDivisionError):
+        return Exception(f"Runtime error{where}: division by zero")
+    if isinstance(error, RecursionError):
+        return Exception(f"Runtime error{where}: call stack overflow")
+    if isinstance(error, NameError) and error.name and error.name.startswith("f_"):
+        return Exception(f"Undefined function: '{error.name[2:]}'")
+    return error
+
+def call_deep(function, args=(), write=None):
+    """
+    Calls a generated function on a fresh thread with a deep stack and the
+    recursion limit raised for as long as any such call is running.
+    """
+    global _deep_calls, _saved_limit
+    outcome = []
+
+    def target():
+        _local.write = write or sys.stdout.write
+        try:
+            outcome.append((True, function(*args)))
+        except BaseException as e:
+            outcome.append((False, e))
+
+    with _deep_lock:
+        if _deep_calls == 0:
+            _saved_limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(max(_saved_limit, RECURSION_LIMIT))
+        _deep_calls += 1
+        previous = threading.stack_size(STACK_SIZE)
+        try:
+            thread = threading.Thread(target=target, name="sanskrit")
+            thread.start()
+        finally:
+            threading.stack_size(previous)
+    try:
+        thread.join()
+    finally:
+        with _deep_lock:
+            _deep_calls -= 1
+            if _deep_calls == 0:
+                sys.setrecursionlimit(_saved_limit)
+    ok, value = outcome[0]
+    if ok:
+        return value
+    raise runtime_error(value) from None
+
+def call_captured(function, args=(), inline=True):
+    """
+    Calls a generated function and returns its result with what it printed.
+    With `inline` it runs on the calling thread first, and only a call that
+    recurses past the recursion limit is run again from the start on a
+    deep-stack thread, which is safe because a call's only effect is the
+    output it returns. Programs with memoized functions must not run inline:
+    each lru_cache call nests on the C stack, which a recursion limit raised
+    by another thread's deep call would let them overflow.
+    """
+    if inline:
+        output = []
+        _local.write = output.append
+        try:
+            return function(*args), "".join(output)
+        except RecursionError:
+            pass
+        except Exception as e:
+            raise runtime_error(e) from None
+    output = []
+    return call_deep(function, args, output.append), "".join(output)
+
+def load_module(code):
+    """Executes a program's code object and returns the namespace holding its functions."""
+    namespace = {"__name__": "sanskrit_program"}
+    exec(code, namespace)
+    namespace["_write"] = _write
+    return namespace
+
+def run_code(code, write=None, name='main'):
+    """
+    Executes a program's code object and runs the named function with no
+    arguments. Returns its result and the module namespace the program ran
+    in; `write` receives everything लेखय prints.
+    """
+    namespace = load_module(code)
+    function = namespace.get("f_" + name)
+    if function is None:
+        raise Exception(f"No function named '{name}' to run")
+    return call_deep(function, (), write), namespace
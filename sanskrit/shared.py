@@ -0,0 +1,102 @@
+import ctypes
+import os
+import shutil
+import tempfile
+
+from .backend import SharedBackend
+from .cache import CXX, build_piped
+from .compiler import Compiler
+
+# =====================================================================
+# Shared Libraries
+# =====================================================================
+# Builds a program as a shared library with the local g++ and loads it
+# with ctypes, so each कार्यम् can be called from Python in about a
+# microsecond instead of paying for a process, dynamic linking and
+# iostream start-up on every run. A library built from the same source
+# and flags is reused from the BuildCache. Runtime errors such as division
+# by zero come back as exceptions; a native stack overflow still ends the
+# process, as it would the program's.
+
+def build_shared(source, flags, output, cache=None, opt="2"):
+    """
+    Builds the shared library for a program at `output` with the given
+    Compiler flags, reusing a cached one built from the same source and
+    flags. Returns True if it came from the cache.
+    """
+    options = SharedBackend.OPTIONS + [f"-O{opt}"]
+    key = cache.key(source, dict(flags, unit="shared", options=options)) if cache else None
+    cached = cache.lookup(key, "program.so") if cache else None
+    # Built beside `output` and renamed over it, so a copy that is already
+    # loaded somewhere is never rewritten in place
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output)), suffix=".so")
+    os.close(fd)
+    try:
+        if cached is not None:
+            shutil.copyfile(cached, temp_path)
+        else:
+            build_piped(Compiler(source, shared=True, **flags), temp_path, SharedBackend.LANGUAGE,
+                        CXX, options)
+            if cache:
+                with open(temp_path, "rb") as f:
+                    cache.store(key, "program.so", f.read())
+        os.replace(temp_path, output)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return cached is not None
+
+class SharedLibrary:
+    """
+    A program's shared library loaded with ctypes. call() runs a function
+    by its Sanskrit name or C spelling; output() returns what लेखय printed
+    on the calling thread. The library keeps that output and its error
+    state per thread, so calls from several threads do not mix.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.library = ctypes.CDLL(os.path.abspath(path))
+        for name, restype in (("sanskrit_output_data", ctypes.c_void_p),
+                              ("sanskrit_output_size", ctypes.c_size_t),
+                              ("sanskrit_error_function", ctypes.c_char_p),
+                              ("sanskrit_error", ctypes.c_char_p),
+                              ("sanskrit_functions", ctypes.c_char_p)):
+            getattr(self.library, name).restype = restype
+            getattr(self.library, name).argtypes = ()
+        self.library.sanskrit_output_clear.argtypes = ()
+        self.library.sanskrit_output_clear.restype = None
+        self.exported = []      # (Sanskrit name, C spelling, parameter count) in definition order
+        # Sanskrit name and C spelling -> (C spelling, parameter count, entry point)
+        self.functions = {}
+        for row in self.library.sanskrit_functions().decode("utf-8").splitlines():
+            name, spelling, arity = row.split("\t")
+            self.exported.append((name, spelling, int(arity)))
+            entry = getattr(self.library, "sanskrit_entry_" + spelling)
+            entry.restype = ctypes.c_int
+            entry.argtypes = [ctypes.POINTER(ctypes.c_int)] + [ctypes.c_int] * int(arity)
+            self.functions[name] = self.functions[spelling] = (spelling, int(arity), entry)
+
+    def call(self, name, *args):
+        """Calls a function with int arguments and returns its int result."""
+        function = self.functions.get(name)
+        if function is None:
+            raise Exception(f"Undefined function: '{name}'")
+        spelling, arity, entry = function
+        if len(args) != arity:
+            raise Exception(f"Function '{name}' takes {arity} arguments, got {len(args)}")
+        failed = ctypes.c_int(0)
+        result = entry(ctypes.byref(failed), *args)
+        if failed.value:
+            raise Exception(f"Runtime error in '{self.library.sanskrit_error_function().decode()}': "
+                            f"{self.library.sanskrit_error().decode()}")
+        return result
+
+    def output(self):
+        """Returns what लेखय has printed on this thread since the last call, and clears it."""
+        size = self.library.sanskrit_output_size()
+        if not size:
+            return ""
+        text = ctypes.string_at(self.library.sanskrit_output_data(), size).decode()
+        self.library.sanskrit_output_clear()
+        return text
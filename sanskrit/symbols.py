@@ -0,0 +1,64 @@
+# =====================================================================
+# Symbol Table
+# =====================================================================
+# The names visible at each point of a program, with what is known about
+# each one. Scopes nest (function, then every यदि, अन्यथा and दौर body);
+# a name declared in an inner scope hides an outer one until the inner
+# scope closes.
+
+class Symbol:
+    """One declared name and the facts later passes may want about it."""
+    __slots__ = ('name', 'spelling', 'kind', 'type', 'function', 'site', 'uses')
+
+    def __init__(self, name, spelling, kind, function=None, site=None):
+        self.name = name            # as written in the source
+        self.spelling = spelling    # C spelling, shared by every symbol of the same name and kind
+        self.kind = kind            # 'function', 'parameter' or 'variable'
+        self.type = 'int'           # the only type the language has so far
+        self.function = function    # spelling of the enclosing function; None for functions
+        self.site = site            # IR node that declares it: IRFunction or IRDeclare
+        self.uses = 0               # reads of a variable or parameter, calls of a function
+
+    def __repr__(self):
+        return f"Symbol({self.name!r}, {self.spelling!r}, {self.kind!r}, uses={self.uses})"
+
+class SymbolTable:
+    """
+    Scoped symbol table. Every visible name maps straight to its innermost
+    symbol, and each open scope remembers what its declarations hid, so
+    lookup and opening a scope are O(1) and closing one costs only the
+    declarations it made.
+    """
+    def __init__(self):
+        self.functions = {}     # function name -> Symbol; one program-wide namespace
+        self.visible = {}       # variable or parameter name -> innermost Symbol
+        self.scopes = []        # per open scope: (name, hidden Symbol or None) per declaration
+        self.symbols = []       # every symbol ever declared, in declaration order
+
+    def push(self):
+        self.scopes.append([])
+
+    def pop(self):
+        for name, hidden in reversed(self.scopes.pop()):
+            if hidden is None:
+                del self.visible[name]
+            else:
+                self.visible[name] = hidden
+
+    def declare_function(self, name, spelling):
+        symbol = Symbol(name, spelling, 'function')
+        self.functions[name] = symbol
+        self.symbols.append(symbol)
+        return symbol
+
+    def declare(self, name, spelling, kind, function, site=None):
+        """Declares a variable or parameter in the innermost scope."""
+        symbol = Symbol(name, spelling, kind, function, site)
+        self.scopes[-1].append((name, self.visible.get(name)))
+        self.visible[name] = symbol
+        self.symbols.append(symbol)
+        return symbol
+
+    def lookup(self, name):
+        """Returns the innermost visible variable or parameter called `name`, or None."""
+        return self.visible.get(name)
@@ -0,0 +1,95 @@
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from .cache import compiler_version
+from .nodes import If, While
+
+# =====================================================================
+# Phase Timings
+# =====================================================================
+# Wall time (and optionally allocations) for each compiler phase, plus
+# counts of what was compiled, as a table or as JSON for tracking
+# regressions across versions.
+
+class PhaseTimer:
+    def __init__(self, allocations=False):
+        self.allocations = allocations
+        self.phases = []    # (name, seconds, allocated bytes, peak bytes)
+        self.counts = {}
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name):
+        """Times the enclosed block as one phase."""
+        if self.allocations:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = peak = None
+            if self.allocations:
+                current, highest = tracemalloc.get_traced_memory()
+                allocated, peak = current - before, highest - before
+            self.phases.append((name, elapsed, allocated, peak))
+
+    def count(self, name, value):
+        self.counts[name] = value
+
+    def report(self):
+        """Returns the timings as a JSON-serializable dict."""
+        phases = []
+        for name, seconds, allocated, peak in self.phases:
+            entry = {"name": name, "ms": round(seconds * 1000, 3)}
+            if allocated is not None:
+                entry["allocated_bytes"] = allocated
+                entry["peak_bytes"] = peak
+            phases.append(entry)
+        return {
+            "compiler_version": compiler_version(),
+            "python": sys.version.split()[0],
+            "total_ms": round(sum(seconds for _, seconds, _, _ in self.phases) * 1000, 3),
+            "phases": phases,
+            "counts": dict(self.counts),
+        }
+
+    def print_report(self):
+        report = self.report()
+        print("--- Phase Timings ---")
+        for entry in report["phases"]:
+            line = f"  {entry['name']:<18} {entry['ms']:>10.3f} ms"
+            if "allocated_bytes" in entry:
+                line += f"  {entry['allocated_bytes'] / 1024:>10.1f} KiB kept" \
+                        f"  {entry['peak_bytes'] / 1024:>10.1f} KiB peak"
+            print(line)
+        print(f"  {'total':<18} {report['total_ms']:>10.3f} ms")
+        print("  " + ", ".join(f"{value:,} {name}" for name, value in report["counts"].items()))
+        print("---------------------")
+
+    def write_json(self, path):
+        """Writes the report to a file, or to stdout for '-'."""
+        text = json.dumps(self.report(), indent=2)
+        if path == "-":
+            print(text)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+
+def count_statements(statements):
+    """Counts the statements in a block, including those in nested blocks."""
+    total = 0
+    for stmt in statements:
+        total += 1
+        if type(stmt) is If:
+            total += count_statements(stmt.body)
+            if stmt.orelse is not None:
+                total += count_statements(stmt.orelse)
+        elif type(stmt) is While:
+            total += count_statements(stmt.body)
+    return total
@@ -0,0 +1,311 @@
+import sys
+
+from .ir import IRBinary, IRCall, IRConst, IRDeclare, IRGroup, IRIf, IRLoad, IRPrint, IRReturn, \
+    IRStore, IRUnary, IRWhile
+from .nodes import walk_postorder
+from .optimize import INT_MAX, INT_MIN, MEMO_SIZE
+
+# =====================================================================
+# Bytecode Interpreter
+# =====================================================================
+# Runs a program in-process without a C++ toolchain. Each IR function is
+# compiled to a flat list of (opcode, argument) pairs that a stack-based
+# dispatch loop executes. Values behave like 32-bit C ints.
+
+OP_LOAD          = 0   # push local[arg]
+OP_CONST         = 1   # push arg
+OP_STORE         = 2   # pop into local[arg]
+OP_ADD           = 3
+OP_SUB           = 4
+OP_MUL           = 5
+OP_DIV           = 6
+OP_MOD           = 7
+OP_LT            = 8
+OP_GT            = 9
+OP_LE            = 10
+OP_GE            = 11
+OP_EQ            = 12
+OP_NEG           = 13
+OP_JUMP          = 14  # pc = arg
+OP_JUMP_IF_FALSE = 15  # pop; pc = arg if it was 0
+OP_CALL          = 16  # call functions[arg] with its arguments from the stack
+OP_RETURN        = 17  # pop the return value
+OP_PRINT         = 18  # pop and print
+OP_POP           = 19  # discard an expression statement's value
+OP_TAIL_CALL     = 20  # call functions[arg] in place of the current frame
+
+# Deepest call chain the VM allows before reporting a stack overflow
+MAX_CALL_DEPTH = 1_000_000
+
+BINARY_OPCODES = {
+    '+': OP_ADD, '-': OP_SUB, '*': OP_MUL, '/': OP_DIV, '%': OP_MOD,
+    '<': OP_LT, '>': OP_GT, '<=': OP_LE, '>=': OP_GE, '==': OP_EQ,
+}
+
+def wrap_int(value):
+    """Wraps an arbitrary Python int to a 32-bit two's complement C int."""
+    return ((value + 2**31) & 0xFFFFFFFF) - 2**31
+
+class BytecodeFunction:
+    """A compiled function: its bytecode, argument count and local slot count."""
+    __slots__ = ('name', 'argc', 'nlocals', 'code', 'padding', 'memo', 'memo_size', 'hits', 'misses')
+
+    def __init__(self, name, argc):
+        self.name = name
+        self.argc = argc
+        self.nlocals = argc
+        self.code = []
+        self.padding = []   # zeroed non-parameter locals appended on each call
+        self.memo = None    # argument tuple -> result, in least recently used order
+        self.memo_size = 0
+        self.hits = 0
+        self.misses = 0
+
+class BytecodeCompiler:
+    """Compiles an IR program to bytecode, checking names as C would."""
+    def __init__(self, program, memoize=(), memo_size=None):
+        self.program = program
+        self.functions = []
+        self.function_index = {}
+        for func in program.functions:
+            if func.name in self.function_index:
+                raise Exception(f"Duplicate function: '{func.name}'")
+            self.function_index[func.name] = len(self.functions)
+            target = BytecodeFunction(func.name, len(func.params))
+            if func.name in memoize:
+                target.memo = {}
+                target.memo_size = memo_size or MEMO_SIZE
+            self.functions.append(target)
+
+    def compile(self):
+        """Returns the list of BytecodeFunctions, in definition order."""
+        for func, target in zip(self.program.functions, self.functions):
+            self.target = target
+            self.slots = {param: index for index, param in enumerate(func.params)}
+            self.scopes = [set(func.params)]
+            self.block(func.body)
+            # Falling off the end of a function returns 0
+            target.code += [OP_CONST, 0, OP_RETURN, 0]
+            target.nlocals = len(self.slots)
+            target.padding = [0] * (target.nlocals - target.argc)
+        return self.functions
+
+    def emit(self, op, arg=0):
+        self.target.code += [op, arg]
+        return len(self.target.code) - 1   # position of the argument, for patching
+
+    def memoized(self, name):
+        index = self.function_index.get(name)
+        return index is not None and self.functions[index].memo is not None
+
+    def slot(self, name):
+        """Returns the local slot of a variable visible in the current scope."""
+        for scope in self.scopes:
+            if name in scope:
+                return self.slots[name]
+        raise Exception(f"Undefined variable: '{name}'")
+
+    def block(self, statements):
+        self.scopes.append(set())
+        for stmt in statements:
+            self.statement(stmt)
+        self.scopes.pop()
+
+    def statement(self, stmt):
+        kind = type(stmt)
+        if kind is IRDeclare:
+            self.expression(stmt.value)
+            self.scopes[-1].add(stmt.name)
+            self.emit(OP_STORE, self.slots.setdefault(stmt.name, len(self.slots)))
+        elif kind is IRStore:
+            self.expression(stmt.value)
+            self.emit(OP_STORE, self.slot(stmt.name))
+        elif kind is IRPrint:
+            self.expression(stmt.value)
+            self.emit(OP_PRINT)
+        elif kind is IRReturn:
+            value = stmt.value
+            while type(value) is IRGroup:
+                value = value.expr
+            # प्रतिफलम् f(...) reuses the current frame instead of nesting, unless
+            # a memo cache still has to record the result of either function
+            if type(value) is IRCall and not self.memoized(self.target.name) \
+               and not self.memoized(value.name):
+                self.call(value, OP_TAIL_CALL)
+            else:
+                self.expression(value)
+                self.emit(OP_RETURN)
+        elif kind is IRIf:
+            self.expression(stmt.condition)
+            to_else = self.emit(OP_JUMP_IF_FALSE)
+            self.block(stmt.body)
+            if stmt.orelse is not None:
+                to_end = self.emit(OP_JUMP)
+                self.target.code[to_else] = len(self.target.code)
+                self.block(stmt.orelse)
+                self.target.code[to_end] = len(self.target.code)
+            else:
+                self.target.code[to_else] = len(self.target.code)
+        elif kind is IRWhile:
+            start = len(self.target.code)
+            self.expression(stmt.condition)
+            to_end = self.emit(OP_JUMP_IF_FALSE)
+            self.block(stmt.body)
+            self.emit(OP_JUMP, start)
+            self.target.code[to_end] = len(self.target.code)
+        else:
+            self.expression(stmt.value)
+            self.emit(OP_POP)
+
+    def expression(self, expr):
+        # Stack code is the tree in postorder: operands, then their operator
+        walk_postorder(expr, self.expression_node)
+
+    def expression_node(self, expr, operands):
+        """Emits the instruction for one node after its operands' code."""
+        kind = type(expr)
+        if kind is IRConst:
+            self.emit(OP_CONST, wrap_int(expr.value))
+        elif kind is IRLoad:
+            self.emit(OP_LOAD, self.slot(expr.name))
+        elif kind is IRBinary:
+            self.emit(BINARY_OPCODES[expr.op])
+        elif kind is IRUnary:
+            if expr.op == '-':
+                self.emit(OP_NEG)
+        elif kind is IRCall:
+            self.emit(OP_CALL, self.callee(expr))
+
+    def callee(self, expr):
+        """Returns the index of the function a call targets, checking its arity."""
+        index = self.function_index.get(expr.name)
+        if index is None:
+            raise Exception(f"Undefined function: '{expr.name}'")
+        callee = self.functions[index]
+        if len(expr.args) != callee.argc:
+            raise Exception(f"Function '{expr.name}' takes {callee.argc} arguments, "
+                            f"got {len(expr.args)}")
+        return index
+
+    def call(self, expr, op):
+        index = self.callee(expr)
+        for arg in expr.args:
+            self.expression(arg)
+        self.emit(op, index)
+
+class VirtualMachine:
+    """Executes bytecode functions; `write` receives everything लेखय prints."""
+    def __init__(self, functions, write=None):
+        self.functions = functions
+        self.write = write or sys.stdout.write
+
+    def run(self, name='main'):
+        """Runs the named function with no arguments and returns its result."""
+        for func in self.functions:
+            if func.name == name:
+                return self.execute(func, [])
+        raise Exception(f"No function named '{name}' to run")
+
+    def execute(self, func, args):
+        """
+        Runs a function to completion. Calls push a frame onto an explicit
+        stack rather than recursing in Python, so call depth is limited only
+        by MAX_CALL_DEPTH, and tail calls replace the current frame.
+        """
+        functions = self.functions
+        write = self.write
+        frames = []
+        code = func.code
+        local = args + func.padding
+        pc = 0
+        memo_key = None     # arguments to cache this frame's result under
+        # One operand stack shared by all frames: statements leave it balanced,
+        # so a returning callee leaves exactly its result on top.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        while True:
+            op = code[pc]
+            arg = code[pc + 1]
+            pc += 2
+            if op == OP_LOAD:
+                push(local[arg])
+            elif op == OP_CONST:
+                push(arg)
+            elif op == OP_STORE:
+                local[arg] = pop()
+            elif op == OP_JUMP_IF_FALSE:
+                if not pop():
+                    pc = arg
+            elif op == OP_JUMP:
+                pc = arg
+            elif op <= OP_MUL:
+                b = pop()
+                a = stack[-1]
+                value = a + b if op == OP_ADD else a - b if op == OP_SUB else a * b
+                if not INT_MIN <= value <= INT_MAX:
+                    value = wrap_int(value)
+                stack[-1] = value
+            elif op <= OP_EQ:
+                b = pop()
+                a = stack[-1]
+                if op == OP_LT:
+                    stack[-1] = 1 if a < b else 0
+                elif op == OP_GT:
+                    stack[-1] = 1 if a > b else 0
+                elif op == OP_LE:
+                    stack[-1] = 1 if a <= b else 0
+                elif op == OP_GE:
+                    stack[-1] = 1 if a >= b else 0
+                elif op == OP_EQ:
+                    stack[-1] = 1 if a == b else 0
+                else:
+                    if b == 0:
+                        raise Exception(f"Runtime error in '{func.name}': division by zero")
+                    quotient = abs(a) // abs(b)
+                    if (a < 0) != (b < 0):
+                        quotient = -quotient
+                    stack[-1] = wrap_int(quotient) if op == OP_DIV else a - b * quotient
+            elif op == OP_CALL or op == OP_TAIL_CALL:
+                callee = functions[arg]
+                argc = callee.argc
+                if argc:
+                    new_local = stack[-argc:] + callee.padding
+                    del stack[-argc:]
+                else:
+                    new_local = callee.padding[:]
+                new_key = None
+                if callee.memo is not None:
+                    new_key = tuple(new_local[:argc])
+                    memo = callee.memo
+                    if new_key in memo:
+                        # Move the entry to the most recently used end
+                        value = memo[new_key] = memo.pop(new_key)
+                        callee.hits += 1
+                        push(value)
+                        continue
+                    callee.misses += 1
+                if op == OP_CALL:
+                    if len(frames) >= MAX_CALL_DEPTH:
+                        raise Exception(f"Runtime error in '{callee.name}': call stack overflow")
+                    frames.append((func, code, local, pc, memo_key))
+                func = callee
+                code = callee.code
+                local = new_local
+                pc = 0
+                memo_key = new_key
+            elif op == OP_RETURN:
+                if memo_key is not None:
+                    memo = func.memo
+                    memo[memo_key] = stack[-1]
+                    if len(memo) > func.memo_size:
+                        del memo[next(iter(memo))]
+                if not frames:
+                    return pop()
+                func, code, local, pc, memo_key = frames.pop()
+            elif op == OP_PRINT:
+                write(f"{pop()}\n")
+            elif op == OP_NEG:
+                stack[-1] = wrap_int(-stack[-1])
+            else:
+                pop()
@@ -0,0 +1,72 @@
+import os
+import shutil
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import sanskrit
+from sanskrit.api import VMEngine
+
+PROGRAM = """
+कार्यम् योगम्(a, b) {
+    लेखय(a + b);
+    प्रतिफलम् a + b;
+}
+
+कार्यम् भाग(a, b) {
+    प्रतिफलम् a / b;
+}
+
+कार्यम् मुख्य() {
+    लेखय(योगम्(2, 3));
+    प्रतिफलम् 7;
+}
+"""
+
+# दौर loops nested deeper than CPython compiles
+DEEP_LOOPS = "कार्यम् मुख्य() {\n    स्थापय x = 0;\n" + "".join(
+    "    " * (level + 1) + f"दौर (x < {level + 1}) {{\n" for level in range(24)) + \
+    "    " * 25 + "स्थापय x = x + 100;\n" + "".join(
+    "    " * (level + 1) + "}\n" for level in reversed(range(24))) + \
+    "    लेखय(x);\n    प्रतिफलम् 0;\n}\n"
+
+ENGINES = ['python', 'vm'] + (['native'] if shutil.which("g++") else [])
+
+
+class CompileTests(unittest.TestCase):
+    def test_run_and_call(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                program = sanskrit.compile(PROGRAM, engine=engine)
+                result = program.run()
+                self.assertEqual((result.value, result.output), (7, "5\n5\n"))
+                result = program.call('योगम्', 4, 5)
+                self.assertEqual((result.value, result.output), (9, "9\n"))
+                # By C spelling too, with arguments wrapped into int range
+                self.assertEqual(program.call('yogm', 2**31 - 1, 1).value, -2**31)
+
+    def test_errors(self):
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                program = sanskrit.compile(PROGRAM, engine=engine)
+                with self.assertRaisesRegex(Exception, "division by zero"):
+                    program.call('भाग', 1, 0)
+                with self.assertRaisesRegex(Exception, "Undefined function"):
+                    program.call('अज्ञात')
+                with self.assertRaisesRegex(Exception, "takes 2 arguments"):
+                    program.call('योगम्', 1)
+                # A failed call leaves nothing behind for the next one
+                self.assertEqual(program.call('योगम्', 1, 1).output, "2\n")
+
+    def test_same_program_reused(self):
+        self.assertIs(sanskrit.compile(PROGRAM), sanskrit.compile(PROGRAM))
+
+    def test_python_engine_falls_back_to_vm(self):
+        program = sanskrit.compile(DEEP_LOOPS)
+        self.assertIsInstance(program.engine, VMEngine)
+        self.assertEqual(program.run().output, "100\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
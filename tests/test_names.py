@@ -0,0 +1,78 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler
+
+# A local named after the function it calls
+SHADOWING_LOCAL = """
+कार्यम् क(x) {
+    प्रतिफलम् x + 1;
+}
+
+कार्यम् द्विगुण(n) {
+    स्थापय क = n * 2;
+    प्रतिफलम् क(क);
+}
+
+कार्यम् मुख्य() {
+    लेखय(द्विगुण(5));
+    प्रतिफलम् 0;
+}
+"""
+
+# A recursive function whose parameter has its name
+SHADOWING_PARAMETER = """
+कार्यम् गणना(गणना) {
+    यदि (गणना <= 0) {
+        प्रतिफलम् 0;
+    }
+    प्रतिफलम् गणना + गणना(गणना - 1);
+}
+
+कार्यम् मुख्य() {
+    लेखय(गणना(4));
+    प्रतिफलम् 0;
+}
+"""
+
+# Names that transliterate to C++ alternative tokens (or, not)
+KEYWORD_NAMES = """
+कार्यम् ओर(नोत) {
+    प्रतिफलम् नोत + 1;
+}
+
+कार्यम् मुख्य() {
+    लेखय(ओर(2));
+    प्रतिफलम् 0;
+}
+"""
+
+
+@unittest.skipIf(shutil.which("g++") is None, "g++ is not installed")
+class NameTests(unittest.TestCase):
+    def run_native(self, source):
+        """Builds the program's C++ with g++ and returns what it prints."""
+        with tempfile.TemporaryDirectory() as directory:
+            binary = os.path.join(directory, "program")
+            subprocess.run(["g++", "-x", "c++", "-", "-o", binary],
+                           input=Compiler(source).compile(), text=True, check=True)
+            return subprocess.run([binary], capture_output=True, text=True, check=True).stdout
+
+    def test_local_named_after_function(self):
+        self.assertEqual(self.run_native(SHADOWING_LOCAL), "11\n")
+
+    def test_parameter_named_after_function(self):
+        self.assertEqual(self.run_native(SHADOWING_PARAMETER), "10\n")
+
+    def test_names_that_are_keywords(self):
+        self.assertEqual(self.run_native(KEYWORD_NAMES), "3\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
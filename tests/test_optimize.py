@@ -0,0 +1,120 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler, VirtualMachine
+
+# Every combination of passes a program is run under
+PASSES = [
+    {},
+    {"fold": False},
+    {"dce": False},
+    {"licm": False},
+    {"fold": False, "dce": False, "licm": False},
+]
+
+# Division by zero in branches that never run
+DEAD_DIVISION = """
+कार्यम् मुख्य() {
+    स्थापय x = 0;
+    यदि (0) {
+        लेखय(1 / x);
+    }
+    यदि (x > 5) {
+        लेखय(7 / x);
+    }
+    लेखय(x);
+    प्रतिफलम् 0;
+}
+"""
+
+# Loop-invariant work, and a division that must not be hoisted, in a loop
+# that runs zero times
+ZERO_TRIP_LOOP = """
+कार्यम् गणना(n, d) {
+    स्थापय i = 0;
+    स्थापय s = 0;
+    दौर (i < n) {
+        स्थापय s = s + d * 7 + 100 / d;
+        स्थापय i = i + 1;
+    }
+    प्रतिफलम् s;
+}
+
+कार्यम् मुख्य() {
+    लेखय(गणना(0, 0));
+    लेखय(गणना(3, 5));
+    प्रतिफलम् 0;
+}
+"""
+
+# Constant arithmetic that leaves the int32 range
+OVERFLOW = """
+कार्यम् मुख्य() {
+    स्थापय x = 2147483647 + 1;
+    लेखय(x);
+    लेखय(-2147483647 - 2);
+    लेखय(65536 * 65536);
+    लेखय((0 - 2147483647 - 1) / -1);
+    लेखय(-7 / 2);
+    लेखय(-7 % 2);
+    प्रतिफलम् 0;
+}
+"""
+
+# Division by zero in code that does run
+LIVE_DIVISION = """
+कार्यम् मुख्य() {
+    लेखय(1);
+    लेखय(1 / 0);
+    प्रतिफलम् 0;
+}
+"""
+
+
+def run_vm(source, **flags):
+    """Runs a program on the VM and returns (exit code, output)."""
+    output = []
+    code = VirtualMachine(Compiler(source, **flags).compile_bytecode(), output.append).run()
+    return code, "".join(output)
+
+
+class OptimizationTests(unittest.TestCase):
+    def assertSameOnEveryPass(self, source, expected):
+        for flags in PASSES:
+            with self.subTest(**flags):
+                self.assertEqual(run_vm(source, **flags), (0, expected))
+
+    def test_division_by_zero_in_dead_branch(self):
+        self.assertSameOnEveryPass(DEAD_DIVISION, "0\n")
+        compiler = Compiler(DEAD_DIVISION)
+        compiler.compile()
+        self.assertIn(('मुख्य', 'body of a यदि that is never true'), compiler.eliminator.dropped)
+
+    def test_invariant_in_loop_that_never_runs(self):
+        self.assertSameOnEveryPass(ZERO_TRIP_LOOP, "0\n165\n")
+        compiler = Compiler(ZERO_TRIP_LOOP)
+        compiler.compile()
+        self.assertEqual(compiler.hoister.hoisted, 1)
+
+    def test_folding_wraps_like_int32(self):
+        expected = "-2147483648\n2147483647\n0\n-2147483648\n-3\n-1\n"
+        self.assertSameOnEveryPass(OVERFLOW, expected)
+        compiler = Compiler(OVERFLOW)
+        compiler.compile()
+        self.assertGreater(compiler.folder.folded, 0)
+
+    def test_live_division_by_zero_fails_at_run_time(self):
+        for flags in PASSES:
+            with self.subTest(**flags):
+                functions = Compiler(LIVE_DIVISION, **flags).compile_bytecode()
+                output = []
+                with self.assertRaisesRegex(Exception, "division by zero"):
+                    VirtualMachine(functions, output.append).run()
+                self.assertEqual(output, ["1\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
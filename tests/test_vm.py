@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sanskrit import Compiler, VirtualMachine
+
+# A million self tail calls, ending in a tail call to another function
+TAIL_CALLS = """
+कार्यम् अन्त(acc) {
+    प्रतिफलम् acc * 2;
+}
+
+कार्यम् गण(n, acc) {
+    यदि (n == 0) {
+        प्रतिफलम् अन्त(acc);
+    }
+    प्रतिफलम् गण(n - 1, acc + 1);
+}
+
+कार्यम् मुख्य() {
+    लेखय(गण(1000000, 0));
+    प्रतिफलम् 0;
+}
+"""
+
+FIBONACCI = """
+कार्यम् फिब(n) {
+    यदि (n < 2) {
+        प्रतिफलम् n;
+    }
+    प्रतिफलम् फिब(n - 1) + फिब(n - 2);
+}
+
+कार्यम् मुख्य() {
+    लेखय(फिब(30));
+    प्रतिफलम् 0;
+}
+"""
+
+
+def run(functions):
+    output = []
+    code = VirtualMachine(functions, output.append).run()
+    return code, "".join(output)
+
+
+class VirtualMachineTests(unittest.TestCase):
+    def test_tail_calls_a_million_deep(self):
+        self.assertEqual(run(Compiler(TAIL_CALLS).compile_bytecode()), (0, "2000000\n"))
+
+    def test_memo_counters(self):
+        functions = Compiler(FIBONACCI, memoize=True).compile_bytecode()
+        self.assertEqual(run(functions), (0, "832040\n"))
+        memoized = {func.name: (func.hits, func.misses) for func in functions
+                    if func.memo is not None}
+        # फिब(0) to फिब(30) each miss once; every other call hits
+        self.assertEqual(memoized, {'phib': (28, 31)})
+
+    def test_memo_size_evicts(self):
+        functions = Compiler(FIBONACCI, memoize=True, memo_size=1).compile_bytecode()
+        self.assertEqual(run(functions), (0, "832040\n"))
+        fib = next(func for func in functions if func.memo is not None)
+        self.assertLessEqual(len(fib.memo), 1)
+        self.assertGreater(fib.misses, 31)
+
+
+if __name__ == "__main__":
+    unittest.main()